@@ -7,7 +7,8 @@ from modules.detailedView import render_detailed_view
 from modules.investView import render_invest_view
 from modules.mechanismView import render_mechanism_view
 from modules.simpleView import render_simple_view
-from utils.calculations import compute_paywise, yearly_view
+from utils.calculations import yearly_view
+from utils.paywise_cache import cached_compute_paywise
 from utils.paywise_summary import build_paywise_summary
 from utils.pdf_export import generate_pdf_report
 
@@ -109,7 +110,7 @@ def render_paywise_header() -> None:
 
 
 def render_paywise_view(inputs: PaywiseInputs) -> None:
-    data = compute_paywise(
+    data = cached_compute_paywise(
         purchase_amount=inputs.purchase_amount,
         interest_rate=inputs.interest_rate,
         tenure=inputs.tenure,
@@ -118,6 +119,7 @@ def render_paywise_view(inputs: PaywiseInputs) -> None:
         cashback_full=inputs.cashback_full,
         cashback_emi=inputs.cashback_emi,
         cashback_nocost=inputs.cashback_nocost,
+        lazy=True,
     )
 
     emi_df = data["emi_df"]
@@ -86,8 +86,10 @@ def render_detailed_view(
         else "Fixed"
     )
 
+    period_column = "Year" if "Year" in display_df.columns else "Month"
+
     detailed_columns = [
-        "Month" if "Month" in display_df.columns else display_df.columns[0],
+        period_column,
         "Principal Paid",
         "Interest",
         "GST on Interest (@18%)",
@@ -99,7 +101,7 @@ def render_detailed_view(
 
     if fee_mode_normalized == "Percentage":
         detailed_columns = [
-            "Month" if "Month" in display_df.columns else display_df.columns[0],
+            period_column,
             "Principal Paid",
             "Interest",
             "GST on Interest (@18%)",
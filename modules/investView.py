@@ -1,19 +1,65 @@
+import numpy as np
 import streamlit as st
 
 from utils.investment import (
     calculate_stepup_sip_inflation_adjusted,
     convert_monthly_to_yearly,
+    sip_milestones,
+    sip_value_grid,
+    sip_values_at,
 )
 from utils.invest_pdf import generate_invest_pdf_bytes
+from utils.sip_goal import required_monthly_sip, required_stepup, required_years
+from utils.sip_simulation import simulate_sip_outcomes
 from modules.invest_sections import (
     render_invest_header,
     render_invest_summary,
+    render_invest_goal,
+    render_invest_heatmap,
     render_invest_overview,
+    render_invest_outlook,
     render_invest_milestones,
     render_invest_report,
     render_invest_disclaimer,
 )
 
+# columns of convert_monthly_to_yearly
+YEARLY_COLUMNS = ["Year", "Total Invested", "Nominal Amount", "Inflation Adjusted Amount"]
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_sip_outcomes(*args, **kwargs):
+    # Monte Carlo is the slowest step of a rerun; reuse it while its inputs hold
+    return simulate_sip_outcomes(*args, **kwargs)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_sip_value_grid(*args):
+    return sip_value_grid(*args)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_monthly_table(*args):
+    return calculate_stepup_sip_inflation_adjusted(*args)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_invest_pdf(monthly_sip, stepup, returns, inflation, years, start_year):
+    # the PDF prints the full monthly schedule; build it once per set of inputs
+    monthly_df = _cached_monthly_table(
+        monthly_sip, stepup, returns, inflation, years, start_year
+    )
+    return generate_invest_pdf_bytes(
+        monthly_df,
+        convert_monthly_to_yearly(monthly_df),
+        monthly_sip,
+        stepup,
+        returns,
+        inflation,
+        years,
+        start_year,
+    ).getvalue()
+
 
 def render_invest_view(animate=True):
     render_invest_header()
@@ -53,6 +99,31 @@ def render_invest_view(animate=True):
             step=0.25,
         )
 
+        st.markdown("### Uncertainty")
+        simulate = st.checkbox("Show range of outcomes", value=False)
+        if simulate:
+            return_volatility = st.number_input(
+                "Return Volatility (% p.a.)",
+                min_value=0.0,
+                max_value=60.0,
+                value=15.0,
+                step=0.5,
+            )
+            inflation_volatility = st.number_input(
+                "Inflation Volatility (% p.a.)",
+                min_value=0.0,
+                max_value=10.0,
+                value=1.0,
+                step=0.25,
+            )
+            target = st.number_input(
+                "Target Real Value (₹)",
+                min_value=0,
+                max_value=1_000_000_000,
+                value=0,
+                step=100_000,
+            )
+
         st.markdown("### Timeline")
         years = st.number_input(
             "Investment Duration (Years)",
@@ -70,41 +141,131 @@ def render_invest_view(animate=True):
         )
         view = st.radio("View Type", ["Yearly", "Monthly"], horizontal=True)
 
-    monthly_df = calculate_stepup_sip_inflation_adjusted(
-        monthly_sip, stepup, returns, inflation, years, start_year
+        st.markdown("### Goal Seek")
+        goal_seek = st.checkbox("Solve for a target value", value=False)
+        if goal_seek:
+            goal_target = st.number_input(
+                "Target Value (₹)",
+                min_value=10_000,
+                max_value=10_000_000_000,
+                value=10_000_000,
+                step=100_000,
+            )
+            goal_value = st.radio(
+                "Target Is",
+                ["real", "nominal"],
+                format_func=lambda v: "Inflation Adjusted" if v == "real" else "Nominal",
+                horizontal=True,
+            )
+            solve_for = st.radio(
+                "Solve For", ["Monthly SIP", "Step-Up", "Duration"], horizontal=True
+            )
+
+    # month 1 and every year end, in closed form; the month-by-month table
+    # is only built (and cached) for the monthly report and the PDF
+    growth_df = sip_values_at(
+        monthly_sip,
+        stepup,
+        returns,
+        inflation,
+        np.r_[1, np.arange(12, years * 12 + 1, 12)],
+        start_year,
     )
-    yearly_df = convert_monthly_to_yearly(monthly_df)
-    final = monthly_df.iloc[-1]
+    final = growth_df.iloc[-1]
+    yearly_df = growth_df.iloc[1:][YEARLY_COLUMNS].reset_index(drop=True)
+    milestones = sip_milestones(monthly_sip, stepup, returns, inflation, years, start_year)
+
+    simulation = None
+    if simulate:
+        simulation = _cached_sip_outcomes(
+            monthly_sip,
+            stepup,
+            returns,
+            inflation,
+            years,
+            start_year,
+            return_volatility=return_volatility,
+            inflation_volatility=inflation_volatility,
+            target=target or None,
+            seed=0,
+        )
 
     render_invest_summary(final)
     st.divider()
 
-    render_invest_overview(final, monthly_df, animate=animate)
+    if goal_seek:
+        if solve_for == "Monthly SIP":
+            answer = required_monthly_sip(
+                goal_target, stepup, returns, inflation, years, value=goal_value
+            )
+        elif solve_for == "Step-Up":
+            answer = required_stepup(
+                goal_target, monthly_sip, returns, inflation, years, value=goal_value
+            )
+        else:
+            answer = required_years(
+                goal_target, monthly_sip, stepup, returns, inflation, value=goal_value
+            )
+        render_invest_goal(solve_for, goal_target, goal_value, float(answer))
+        st.divider()
+
+    render_invest_overview(
+        final,
+        growth_df,
+        animate=animate,
+        bands=simulation["bands"] if simulation else None,
+    )
     st.divider()
 
-    render_invest_milestones(yearly_df, start_year)
+    if simulation:
+        render_invest_outlook(simulation, target)
+        st.divider()
+
+    render_invest_milestones(milestones)
     st.divider()
 
-    display_df = yearly_df if view == "Yearly" else monthly_df
-    render_invest_report(display_df)
+    # the 40 x 25 grid is only computed when the section is switched on
+    if st.checkbox("Show sensitivity heatmap", value=False):
+        grid_axis = st.radio(
+            "Compare Return Against",
+            ["annual_stepup_percent", "annual_inflation_percent"],
+            format_func=lambda v: "Step-Up" if v == "annual_stepup_percent" else "Inflation",
+            horizontal=True,
+        )
+        return_values = np.linspace(max(-5.0, returns - 8), returns + 8, 40)
+        if grid_axis == "annual_stepup_percent":
+            col_values = np.linspace(0.0, 25.0, 25)
+            current_col = stepup
+        else:
+            col_values = np.linspace(max(-2.0, inflation - 4), inflation + 4, 25)
+            current_col = inflation
+        grid = _cached_sip_value_grid(
+            monthly_sip,
+            stepup,
+            returns,
+            inflation,
+            years,
+            "annual_return_percent",
+            return_values,
+            grid_axis,
+            col_values,
+        )
+        render_invest_heatmap(grid["real"], current=(returns, current_col))
     st.divider()
 
-    st.markdown("### 📄 Download Report")
+    if view == "Monthly":
+        render_invest_report(
+            _cached_monthly_table(monthly_sip, stepup, returns, inflation, years, start_year)
+        )
+    else:
+        render_invest_report(yearly_df)
+    st.divider()
 
-    pdf_bytes = generate_invest_pdf_bytes(
-        monthly_df,
-        yearly_df,
-        monthly_sip,
-        stepup,
-        returns,
-        inflation,
-        years,
-        start_year,
-    )
+    st.markdown("### 📄 Download Report")
 
     st.download_button(
         "Download Investment PDF",
-        data=pdf_bytes,
+        data=_cached_invest_pdf(monthly_sip, stepup, returns, inflation, years, start_year),
         file_name="stepup_sip_investment_report.pdf",
         mime="application/pdf",
     )
@@ -1,5 +1,6 @@
 import time
 import matplotlib.pyplot as plt
+import numpy as np
 import streamlit as st
 
 
@@ -68,9 +69,9 @@ def render_invest_donut(invested, real_value):
     st.pyplot(fig, clear_figure=True)
 
 
-def render_growth_chart(monthly_df, animate=True):
+def render_growth_chart(growth_df, animate=True, bands=None):
     chart_slot = st.empty()
-    total = len(monthly_df)
+    total = len(growth_df)
 
     def ease_in_out(t):
         return t * t * (3 - 2 * t)
@@ -98,6 +99,18 @@ def render_growth_chart(monthly_df, animate=True):
             color="#55a868",
             alpha=0.08,
         )
+        if bands is not None:
+            shown = bands[bands["Month Index"] <= subset["Month Index"].iloc[-1]]
+            for label, color in (("Nominal", "#4c72b0"), ("Real", "#55a868")):
+                ax.fill_between(
+                    shown["Month Index"],
+                    shown[f"{label} P10"] / THOUSAND_DIVISOR,
+                    shown[f"{label} P90"] / THOUSAND_DIVISOR,
+                    color=color,
+                    alpha=0.18,
+                    linewidth=0,
+                    label=f"{label} P10–P90",
+                )
         ax.set_title("Growth Trend (Thousands)", color="#e9eef4")
         ax.legend(loc="upper left", frameon=False, labelcolor="#e9eef4")
         ax.grid(True, alpha=0.18, color="#cdd6df")
@@ -107,7 +120,7 @@ def render_growth_chart(monthly_df, animate=True):
         chart_slot.pyplot(fig, clear_figure=True)
 
     if not animate:
-        draw_chart(monthly_df)
+        draw_chart(growth_df)
         return
 
     frames = 10
@@ -115,26 +128,60 @@ def render_growth_chart(monthly_df, animate=True):
         t = i / frames
         eased = ease_in_out(t)
         end = max(1, int(eased * total))
-        subset = monthly_df.iloc[:end]
+        subset = growth_df.iloc[:end]
         draw_chart(subset)
         time.sleep(0.01)
 
 
-def render_invest_overview(final, monthly_df, animate=True):
+def render_invest_overview(final, growth_df, animate=True, bands=None):
     st.markdown("### 📊 Investment Overview")
 
     col1, col2 = st.columns([1, 2], gap="large")
     with col1:
         render_invest_donut(final["Total Invested"], final["Inflation Adjusted Amount"])
     with col2:
-        render_growth_chart(monthly_df, animate=animate)
+        render_growth_chart(growth_df, animate=animate, bands=bands)
 
 
-def render_invest_milestones(yearly_df, start_year):
-    st.markdown("### ⏱️ Growth at 5-Year Milestones")
+def render_invest_outlook(simulation, target=None):
+    st.markdown("### 🎲 Range of Outcomes")
+    st.caption(
+        f"{simulation['n_paths']:,} simulated markets; shaded bands on the chart "
+        "show the 10th–90th percentile."
+    )
 
-    milestones = yearly_df[yearly_df["Year"].sub(start_year).mod(5) == 4].copy()
-    milestones["Years Completed"] = milestones["Year"] - start_year + 1
+    last = simulation["bands"].iloc[-1]
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        st.metric("Real Value (P10)", f"{last['Real P10']:,.0f}")
+    with c2:
+        st.metric("Real Value (P50)", f"{last['Real P50']:,.0f}")
+    with c3:
+        st.metric("Real Value (P90)", f"{last['Real P90']:,.0f}")
+    with c4:
+        if target and simulation["probability"] is not None:
+            st.metric(f"Chance of {target:,.0f}", f"{simulation['probability']:.0%}")
+
+
+def render_invest_goal(solve_for, target, value, answer):
+    st.markdown("### 🎯 Goal Seek")
+    label = "real (inflation-adjusted)" if value == "real" else "nominal"
+    st.caption(f"To reach {target:,.0f} {label} with your other inputs unchanged:")
+
+    if np.isnan(answer):
+        st.warning(f"No {solve_for.lower()} in the allowed range reaches this target.")
+    elif solve_for == "Monthly SIP":
+        st.metric("Required Starting SIP", f"{answer:,.0f}")
+    elif solve_for == "Step-Up" and answer == 0:
+        st.success("Your plan already reaches this target without any step-up.")
+    elif solve_for == "Step-Up":
+        st.metric("Required Annual Step-Up", f"{answer:.2f}%")
+    else:
+        st.metric("Required Duration", f"{answer:.0f} years")
+
+
+def render_invest_milestones(milestones):
+    st.markdown("### ⏱️ Growth at 5-Year Milestones")
 
     st.dataframe(
         milestones[
@@ -154,6 +201,35 @@ def render_invest_milestones(yearly_df, start_year):
     )
 
 
+def render_invest_heatmap(grid, current=None):
+    st.markdown("### 🗺️ Final Real Value Across Assumptions")
+
+    fig, ax = plt.subplots(figsize=(6.4, 3.6), facecolor="none")
+    ax.set_facecolor("#0c1216")
+    rows = grid.index.to_numpy()
+    cols = grid.columns.to_numpy()
+    image = ax.imshow(
+        grid.to_numpy() / THOUSAND_DIVISOR,
+        origin="lower",
+        aspect="auto",
+        cmap="viridis",
+        extent=(cols[0], cols[-1], rows[0], rows[-1]),
+    )
+    if current is not None:
+        ax.plot(current[1], current[0], marker="o", color="white", markersize=6)
+
+    colorbar = fig.colorbar(image, ax=ax)
+    colorbar.set_label("Thousands", color="#e9eef4")
+    colorbar.ax.tick_params(colors="#d7dde4")
+    ax.set_xlabel(grid.columns.name, color="#e9eef4")
+    ax.set_ylabel(grid.index.name, color="#e9eef4")
+    ax.tick_params(colors="#d7dde4")
+    for spine in ax.spines.values():
+        spine.set_color("#3a4149")
+    plt.tight_layout()
+    st.pyplot(fig, clear_figure=True)
+
+
 def render_invest_report(display_df):
     st.markdown("### 📊 Detailed Report")
     st.dataframe(display_df, width="stretch")
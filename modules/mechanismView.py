@@ -1,7 +1,8 @@
 import pandas as pd
 import streamlit as st
 
-from utils.calculations import compute_paywise, GST_RATE
+from utils.calculations import GST_RATE
+from utils.paywise_sensitivity import paywise_delta_arrays, paywise_sensitivities
 
 
 def render_mechanism_view(
@@ -88,48 +89,32 @@ def render_mechanism_view(
 
     st.markdown("**How Small Changes Affect Cost (What-Ifs)**")
 
-    base = data
     scenarios = [
-        ("Interest rate +0.5%", {"interest_rate": interest_rate + 0.5}),
-        ("Tenure +1 month", {"tenure": tenure + 1}),
-        ("Processing fee +₹100", {"processing_fee_base": processing_fee_base + 100}),
-        ("EMI cashback +₹500", {"cashback_emi": cashback_emi + 500}),
+        ("Interest rate +0.5%", ("interest_rate", 0.5)),
+        ("Tenure +1 month", ("tenure", 1)),
+        ("Processing fee +₹100", ("processing_fee_base", 100)),
+        ("EMI cashback +₹500", ("cashback_emi", 500)),
     ]
 
-    rows = []
-    for label, overrides in scenarios:
-        variant = compute_paywise(
-            purchase_amount=purchase_amount,
-            interest_rate=overrides.get("interest_rate", interest_rate),
-            tenure=overrides.get("tenure", tenure),
-            processing_fee_base=overrides.get("processing_fee_base", processing_fee_base),
-            fee_mode=overrides.get("fee_mode", fee_mode),
-            cashback_full=overrides.get("cashback_full", cashback_full),
-            cashback_emi=overrides.get("cashback_emi", cashback_emi),
-            cashback_nocost=overrides.get("cashback_nocost", cashback_nocost),
-        )
+    changes = paywise_delta_arrays(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+        cashback_full,
+        cashback_emi,
+        cashback_nocost,
+        deltas=[delta for _, delta in scenarios],
+    )
 
-        rows.append({
-            "Change": label,
-            "Normal EMI Total Δ": (
-                variant["totals"]["effective_cost_emi"]
-                - base["totals"]["effective_cost_emi"]
-            ),
-            "Normal EMI / month Δ": (
-                variant["averages"]["avg_monthly_outflow"]
-                - base["averages"]["avg_monthly_outflow"]
-            ),
-            "No-Cost Total Δ": (
-                variant["totals"]["effective_cost_nocost"]
-                - base["totals"]["effective_cost_nocost"]
-            ),
-            "Full Payment Total Δ": (
-                variant["totals"]["effective_cost_full"]
-                - base["totals"]["effective_cost_full"]
-            ),
-        })
-
-    delta_df = pd.DataFrame(rows)
+    delta_df = pd.DataFrame({
+        "Change": [label for label, _ in scenarios],
+        "Normal EMI Total Δ": changes["effective_cost_emi"],
+        "Normal EMI / month Δ": changes["avg_monthly_outflow"],
+        "No-Cost Total Δ": changes["effective_cost_nocost"],
+        "Full Payment Total Δ": changes["effective_cost_full"],
+    })
     st.dataframe(
         delta_df.style.format({
             "Normal EMI Total Δ": "{:+,.0f}",
@@ -140,6 +125,41 @@ def render_mechanism_view(
         width="stretch",
     )
 
+    st.markdown("**Sensitivity per Unit Change**")
+
+    partials = paywise_sensitivities(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+    )
+    lever_labels = [
+        ("Interest rate (per 1% p.a.)", "interest_rate"),
+        ("Tenure (per month)", "tenure"),
+        ("Processing fee (per ₹1)", "processing_fee_base"),
+        ("EMI cashback (per ₹1)", "cashback_emi"),
+        ("No-Cost cashback (per ₹1)", "cashback_nocost"),
+    ]
+    sensitivity_df = pd.DataFrame([
+        {
+            "Lever": label,
+            "Normal EMI Total": float(partials[lever]["effective_cost_emi"]),
+            "Normal EMI / month": float(partials[lever]["avg_monthly_outflow"]),
+            "No-Cost Total": float(partials[lever]["effective_cost_nocost"]),
+        }
+        for label, lever in lever_labels
+    ])
+    st.dataframe(
+        sensitivity_df.style.format({
+            "Normal EMI Total": "{:+,.2f}",
+            "Normal EMI / month": "{:+,.2f}",
+            "No-Cost Total": "{:+,.2f}",
+        }),
+        width="stretch",
+    )
+    st.caption("Exact derivatives of the EMI formula at the current inputs.")
+
     st.info(
         "Tip: Use this view to understand which lever changes total cost the most. "
         "Rate and tenure shifts usually dominate."
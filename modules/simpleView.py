@@ -76,8 +76,9 @@ def render_simple_view(
 
     display_df = emi_df if schedule_view == "Monthly" else yearly_view(emi_df)
 
+    period_column = "Year" if "Year" in display_df.columns else "Month"
     display_df = display_df[
-        ["Month", "Total Payment", "Principal Remaining"]
+        [period_column, "Total Payment", "Principal Remaining"]
     ]
 
     st.dataframe(display_df.style.format("{:,.0f}"), width="stretch")
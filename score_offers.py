@@ -0,0 +1,178 @@
+"""
+Batch scoring CLI for offer catalogues (no Streamlit).
+
+    python score_offers.py offers.csv scored.csv --chunk-size 100000
+    python score_offers.py offers.csv scored.parquet
+    python score_offers.py offers.csv scored.csv --workers 8
+
+The input CSV needs purchase_amount, interest_rate and tenure columns;
+processing_fee_base, fee_mode and the three cashback columns are optional.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.paywise_batch import compute_paywise_batch
+from utils.paywise_parallel import compute_paywise_parallel
+
+COST_COLUMNS = ["effective_cost_full", "effective_cost_emi", "effective_cost_nocost"]
+MODE_LABELS = np.array(["Full Payment", "Regular EMI", "No-Cost EMI"])
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def score_chunk(offers: pd.DataFrame, executor=None, block_size=None) -> pd.DataFrame:
+    """
+    Input columns plus the three effective costs, the cheapest mode and
+    its cost. With an `executor` the chunk is split into `block_size`
+    blocks scored on that process pool.
+    """
+    if executor is None:
+        costs = compute_paywise_batch(offers)[COST_COLUMNS]
+    else:
+        block_size = block_size or max(len(offers), 1)
+        costs = compute_paywise_parallel(offers, chunk_size=block_size, executor=executor)[COST_COLUMNS]
+    values = costs.to_numpy()
+    best = values.argmin(axis=1)
+
+    scored = offers.copy()
+    for name in COST_COLUMNS:
+        scored[name] = costs[name].to_numpy()
+    scored["best_mode"] = MODE_LABELS[best]
+    scored["best_cost"] = values[np.arange(len(values)), best]
+    return scored
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self._path = path
+        self._handle = None
+        self._header = True
+
+    def __enter__(self):
+        self._handle = open(self._path, "w", newline="", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._handle.close()
+
+    def write(self, frame):
+        frame.to_csv(self._handle, header=self._header, index=False)
+        self._header = False
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow") from exc
+        self._pa = pa
+        self._pq = pq
+        self._path = path
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._writer is not None:
+            self._writer.close()
+
+    def write(self, frame):
+        table = self._pa.Table.from_pandas(frame, preserve_index=False)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+
+def _open_sink(path, output_format=None):
+    output_format = output_format or ("parquet" if Path(path).suffix == ".parquet" else "csv")
+    if output_format == "parquet":
+        return _ParquetSink(path)
+    return _CsvSink(path)
+
+
+def score_file(
+    input_path,
+    output_path,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    output_format=None,
+    workers=1,
+) -> dict:
+    """
+    Stream `input_path` through score_chunk `chunk_size` rows at a time,
+    appending each scored chunk to `output_path`. Memory use depends on
+    the chunk size, not the file size. With workers > 1 one process pool
+    is kept for the whole file and each chunk is split across it.
+    """
+    started = time.perf_counter()
+    rows = 0
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    block_size = -(-chunk_size // workers)
+    try:
+        with _open_sink(output_path, output_format) as sink:
+            for chunk in pd.read_csv(input_path, chunksize=chunk_size):
+                sink.write(score_chunk(chunk, executor, block_size))
+                rows += len(chunk)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    seconds = time.perf_counter() - started
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else float("inf"),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Score EMI offers from a CSV file.")
+    parser.add_argument("input", help="input CSV of offers")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE:,})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default=None,
+        help="output format (default: from the output file extension)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes per chunk (default 1: score in-process)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.chunk_size < 1:
+        raise SystemExit("--chunk-size must be positive")
+    if args.workers < 1:
+        raise SystemExit("--workers must be positive")
+
+    stats = score_file(args.input, args.output, args.chunk_size, args.format, args.workers)
+    print(
+        f"Scored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+        f"({stats['rows_per_second']:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import json
+
+import numpy as np
+import pytest
+
+from utils.annuity_table import (
+    AnnuityTable,
+    build_annuity_table,
+    load_annuity_table,
+    table_metadata,
+    write_annuity_table,
+)
+from utils.calculations import calculate_emi
+
+
+@pytest.fixture(scope="module")
+def table():
+    return AnnuityTable(build_annuity_table())
+
+
+def test_on_grid_factors_match_exact_formulas(table):
+    rng = np.random.default_rng(3)
+    for step, months in zip(rng.integers(0, 801, 50), rng.integers(3, 361, 50)):
+        rate = step * 0.05
+        growth, emi, interest, gst = table.factors(rate, months)
+        r = rate / 12 / 100
+        assert growth == pytest.approx((1 + r) ** months, rel=1e-12)
+        assert emi == pytest.approx(calculate_emi(1.0, rate, months), rel=1e-12)
+        assert interest == pytest.approx(months * emi - 1, rel=1e-9, abs=1e-12)
+        assert gst == pytest.approx(interest * 0.18, rel=1e-12, abs=1e-12)
+
+    assert table.factors(16.01, 6) is None
+    assert table.factors(16.0, 361) is None
+    assert table.factors(45.0, 12) is None
+
+
+def test_gather_matches_exact_emi(table):
+    steps = np.array([0, 1, 320, 800])
+    months = np.array([3, 360, 6, 24])
+    expected = [calculate_emi(1.0, step * 0.05, n) for step, n in zip(steps, months)]
+
+    np.testing.assert_allclose(table.gather(steps, months), expected, rtol=1e-12)
+
+
+def test_gather_computes_off_grid_positions_exactly(table):
+    # past the last tenure, negative, past the last rate, fractional
+    steps = np.array([10, -1, 801, 10.5, 10])
+    months = np.array([361, 12, 12, 12, 2])
+    expected = calculate_emi(1.0, steps * 0.05, months)
+
+    np.testing.assert_allclose(table.gather(steps, months), expected, rtol=1e-12)
+    assert table.gather(10, 361) == pytest.approx(calculate_emi(1.0, 0.5, 361), rel=1e-12)
+
+
+def test_load_memory_maps_and_rebuilds_stale_file(tmp_path):
+    path = tmp_path / "annuity.npy"
+    np.save(path, np.zeros((2, 2)))
+    assert load_annuity_table(path).values.shape[0] == 4
+    assert isinstance(load_annuity_table(path, build=False).values, np.memmap)
+
+    # same shape, different grid: only the metadata can tell
+    metadata = json.loads((tmp_path / "annuity.npy.json").read_text())
+    (tmp_path / "annuity.npy.json").write_text(json.dumps({**metadata, "rate_step": 0.1}))
+    with pytest.raises(ValueError):
+        load_annuity_table(path, build=False)
+    load_annuity_table(path)
+    assert json.loads((tmp_path / "annuity.npy.json").read_text()) == table_metadata()
+
+
+def test_truncated_file_is_rebuilt(tmp_path):
+    path = write_annuity_table(tmp_path / "annuity.npy")
+    path.write_bytes(path.read_bytes()[:100])
+
+    with pytest.raises(ValueError):
+        load_annuity_table(path, build=False)
+    assert load_annuity_table(path).factors(16.0, 6) is not None
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.breakeven import solve_break_even
+from utils.calculations import compute_paywise
+
+OFFERS = pd.DataFrame({
+    "purchase_amount": [30000, 90000, 120000],
+    "interest_rate": [14.0, 16.0, 0.0],
+    "tenure": [6, 12, 9],
+    "processing_fee_base": [199, 999, 0],
+    "fee_mode": ["Fixed", "Percentage", "Fixed"],
+    "cashback_full": [500, 0, 0],
+    "cashback_emi": [0, 3000, 0],
+    "cashback_nocost": [0, 0, 0],
+})
+
+
+def test_no_cost_cashback_break_even_matches_closed_form():
+    result = solve_break_even(OFFERS, "cashback_nocost", mode_a="nocost", mode_b="full")
+
+    assert result["bracketed"].all()
+    for i, offer in enumerate(OFFERS.to_dict("records")):
+        totals = compute_paywise(**offer)["totals"]
+        expected = (
+            totals["total_gst_interest"]
+            + totals["total_processing_fee"]
+            + totals["total_gst_processing_fee"]
+            + offer["cashback_full"]
+        )
+        assert result["break_even"].iloc[i] == pytest.approx(expected, abs=1e-5)
+
+
+def test_rate_break_even_equalises_modes():
+    result = solve_break_even(OFFERS.iloc[:2], "interest_rate", mode_a="emi", mode_b="nocost")
+
+    for i, offer in enumerate(OFFERS.iloc[:2].to_dict("records")):
+        offer["interest_rate"] = result["break_even"].iloc[i]
+        totals = compute_paywise(**offer)["totals"]
+        assert totals["effective_cost_emi"] == pytest.approx(
+            totals["effective_cost_nocost"], abs=1e-3
+        )
+
+
+def test_unbracketed_offers_report_nan():
+    result = solve_break_even(
+        OFFERS, "processing_fee_base", mode_a="emi", mode_b="full", lower=0, upper=1
+    )
+
+    assert not result["bracketed"].iloc[0]
+    assert np.isnan(result["break_even"].iloc[0])
+
+
+def test_unknown_variable_rejected():
+    with pytest.raises(ValueError):
+        solve_break_even(OFFERS, "purchase_amount")
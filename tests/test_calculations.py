@@ -1,6 +1,24 @@
+import numpy as np
+import pandas as pd
 import pytest
 
-from utils.calculations import compute_paywise, GST_RATE
+from utils.calculations import (
+    GST_RATE,
+    AmortizationSchedule,
+    apply_cashback_to_component_arrays,
+    apply_cashback_to_components,
+    balance_after,
+    calculate_emi,
+    compute_paywise,
+    compute_paywise_schedule,
+    compute_paywise_totals,
+    cumulative_gst,
+    interest_between,
+    net_breakdown_arrays,
+    principal_paid_between,
+    yearly_aggregate,
+    yearly_view,
+)
 
 
 def test_zero_interest_fixed_fee():
@@ -92,3 +110,191 @@ def test_cashback_applies_to_breakdown():
     assert net_total == pytest.approx(gross_total - cashback, abs=0.01)
     assert net_total == pytest.approx(data["totals"]["effective_cost_emi"], abs=0.01)
     assert net_total <= gross_total
+
+
+@pytest.mark.parametrize(
+    "rate, tenure, fee, fee_mode",
+    [
+        (16.0, 6, 299, "Fixed"),
+        (0.0, 12, 500, "Fixed"),
+        (10.5, 360, 1000, "Percentage"),
+        (0.05, 24, 0, "Percentage"),
+    ],
+)
+def test_numpy_engine_matches_loop_engine(rate, tenure, fee, fee_mode):
+    kwargs = {
+        "purchase_amount": 250000,
+        "interest_rate": rate,
+        "tenure": tenure,
+        "processing_fee_base": fee,
+        "fee_mode": fee_mode,
+        "cashback_full": 100,
+        "cashback_emi": 2000,
+        "cashback_nocost": 500,
+    }
+    fast = compute_paywise(engine="numpy", **kwargs)
+    reference = compute_paywise(engine="loop", **kwargs)
+
+    pd.testing.assert_frame_equal(
+        fast["emi_df"], reference["emi_df"], check_exact=False, rtol=1e-9, atol=1e-6
+    )
+    for key, value in reference["totals"].items():
+        assert fast["totals"][key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+    for mode, block in reference["breakdowns"].items():
+        assert fast["breakdowns"][mode]["net_total"] == pytest.approx(
+            block["net_total"], rel=1e-9, abs=1e-6
+        )
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        compute_paywise(12000, 12.0, 12, 0, "Fixed", 0, 0, 0, engine="fortran")
+
+
+@pytest.mark.parametrize("fee_mode", ["Fixed", "Percentage"])
+@pytest.mark.parametrize("rate", [0.0, 16.0])
+def test_totals_fast_path_matches_full_computation(rate, fee_mode):
+    args = (80000, rate, 18, 750, fee_mode, 300, 1200, 45000)
+    full = compute_paywise(*args)
+    fast = compute_paywise_totals(*args)
+
+    assert "emi_df" not in fast
+    for section in ("totals", "averages"):
+        for key, value in full[section].items():
+            assert fast[section][key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+    for fast_row, full_row in zip(fast["comparison"], full["comparison"]):
+        assert fast_row["Total Cost"] == pytest.approx(full_row["Total Cost"], abs=1e-6)
+    for mode, block in full["breakdowns"].items():
+        assert fast["breakdowns"][mode]["net"] == pytest.approx(block["net"], abs=1e-6)
+
+
+def test_lazy_schedule_matches_eager_frame():
+    args = (150000, 13.5, 36, 999, "Fixed")
+    eager = compute_paywise_schedule(*args)
+    lazy = compute_paywise_schedule(*args, lazy=True)
+    schedule = lazy["emi_df"]
+
+    assert isinstance(schedule, AmortizationSchedule)
+    assert len(schedule) == 36
+    assert schedule["EMI"].iloc[0] == pytest.approx(eager["emi_df"]["EMI"].iloc[0])
+    assert schedule.iloc[0]["Processing Fee"] == pytest.approx(999)
+    assert schedule.iloc[-1]["Principal Remaining"] == pytest.approx(0.0, abs=1e-6)
+    pd.testing.assert_frame_equal(
+        schedule.iloc[10:14], eager["emi_df"].iloc[10:14], check_exact=False, rtol=1e-12
+    )
+    pd.testing.assert_frame_equal(schedule.to_frame(), eager["emi_df"])
+    assert schedule.balances() is schedule.balances()
+    assert len(schedule.balances()) == 37
+    for key in ("total_interest", "total_gst_interest", "total_paid"):
+        assert lazy[key] == pytest.approx(eager[key], rel=1e-9)
+
+
+@pytest.mark.parametrize("rate", [0.0, 14.0])
+def test_point_and_range_queries_match_schedule(rate):
+    principal, months = 300000, 48
+    emi_df = compute_paywise(principal, rate, months, 0, "Fixed", 0, 0, 0, engine="loop")["emi_df"]
+    ks = np.array([1, 12, 30, 48])
+
+    assert balance_after(principal, rate, months, ks) == pytest.approx(
+        emi_df["Principal Remaining"].iloc[ks - 1].to_numpy(), abs=1e-6
+    )
+    assert balance_after(principal, rate, months, 0) == pytest.approx(principal)
+    assert cumulative_gst(principal, rate, months, 30) == pytest.approx(
+        emi_df["GST on Interest (@18%)"].iloc[:30].sum(), abs=1e-6
+    )
+    assert interest_between(principal, rate, months, 13, 24) == pytest.approx(
+        emi_df["Interest"].iloc[12:24].sum(), abs=1e-6
+    )
+    assert principal_paid_between(principal, rate, months, [1, 25], [24, 48]) == pytest.approx(
+        [emi_df["Principal Paid"].iloc[:24].sum(), emi_df["Principal Paid"].iloc[24:].sum()],
+        abs=1e-6,
+    )
+
+
+def test_yearly_view_reduces_each_column_sensibly():
+    emi_df = compute_paywise(60000, 12.0, 30, 250, "Fixed", 0, 0, 0)["emi_df"]
+    yearly = yearly_view(emi_df)
+
+    assert list(yearly["Year"]) == [1, 2, 3]
+    assert list(yearly["Month"]) == [12, 24, 30]
+    assert yearly["EMI"].iloc[2] == pytest.approx(emi_df["EMI"].iloc[0])
+    assert yearly["Interest"].iloc[2] == pytest.approx(emi_df["Interest"].iloc[24:].sum())
+    assert yearly["Processing Fee"].iloc[0] == pytest.approx(250)
+    assert yearly["Principal Remaining"].iloc[1] == pytest.approx(
+        emi_df["Principal Remaining"].iloc[23]
+    )
+    assert yearly["Total Payment"].sum() == pytest.approx(emi_df["Total Payment"].sum())
+
+
+def test_yearly_aggregate_matches_yearly_view_per_schedule():
+    frames = [
+        compute_paywise(40000, rate, tenure, 0, "Fixed", 0, 0, 0)["emi_df"]
+        for rate, tenure in [(10.0, 18), (14.0, 36), (0.0, 7)]
+    ]
+    tenure = np.array([len(frame) for frame in frames])
+    columns = {
+        name: np.array([
+            np.pad(frame[name].to_numpy(), (0, tenure.max() - len(frame))) for frame in frames
+        ])
+        for name in ["Month", "EMI", "Interest", "Principal Remaining"]
+    }
+    yearly = yearly_aggregate(columns, tenure)
+
+    for i, frame in enumerate(frames):
+        expected = yearly_view(frame)
+        years = len(expected)
+        for name in columns:
+            assert yearly[name][i, :years] == pytest.approx(expected[name].to_numpy())
+            assert not yearly[name][i, years:].any()
+
+
+def test_cashback_component_arrays_match_scalar_waterfall():
+    rng = np.random.default_rng(5)
+    components = {
+        "principal": rng.uniform(-100, 5_000, 200),
+        "interest": rng.uniform(-100, 800, 200),
+        "tax": rng.uniform(0, 150, 200),
+        "fee": rng.choice([0.0, 352.82], 200),
+    }
+    cashback = rng.uniform(-500, 7_000, 200)
+
+    net = apply_cashback_to_component_arrays(components, cashback)
+    for i in range(200):
+        expected = apply_cashback_to_components(
+            {key: values[i] for key, values in components.items()}, cashback[i]
+        )
+        for key, value in expected.items():
+            assert net[key][i] == pytest.approx(value, abs=1e-9)
+
+
+def test_net_breakdown_arrays_match_compute_paywise():
+    data = compute_paywise(60_000, 15.0, 12, 499, "Fixed", 1_000, 70_000, 2_500)
+    totals = data["totals"]
+    breakdowns = net_breakdown_arrays(
+        np.array([60_000.0]),
+        np.array([totals["total_interest"]]),
+        np.array([totals["total_gst_interest"]]),
+        np.array([totals["total_processing_fee"] + totals["total_gst_processing_fee"]]),
+        np.array([1_000.0]),
+        np.array([70_000.0]),
+        np.array([2_500.0]),
+    )
+    for mode, block in data["breakdowns"].items():
+        assert breakdowns[mode]["net_total"][0] == pytest.approx(block["net_total"])
+        for key, value in block["net"].items():
+            assert breakdowns[mode]["net"][key][0] == pytest.approx(value)
+
+
+def test_calculate_emi_accepts_arrays():
+    months = np.array([3, 12, 60])
+    rates = np.array([0.0, 12.0, 0.001])
+
+    by_months = calculate_emi(100_000, 12.0, months)
+    by_rate = calculate_emi(100_000, rates, 12)
+
+    for value, n in zip(by_months, months):
+        assert value == pytest.approx(calculate_emi(100_000, 12.0, int(n)))
+    for value, rate in zip(by_rate, rates):
+        assert value == pytest.approx(calculate_emi(100_000, float(rate), 12))
+    assert by_rate[0] == pytest.approx(100_000 / 12)
+    assert isinstance(calculate_emi(100_000, 12.0, 12), float)
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.floating_rate import floating_rate_schedule, rate_path_totals
+
+PRINCIPAL, TENURE, RATE = 2_500_000, 240, 8.5
+
+
+def test_flat_path_matches_fixed_rate_schedule():
+    fixed = compute_paywise(PRINCIPAL, RATE, TENURE, 0, "Fixed", 0, 0, 0)
+    floating = floating_rate_schedule(PRINCIPAL, TENURE, RATE, [(13, RATE), (121, RATE)])
+
+    pd.testing.assert_frame_equal(
+        floating, fixed["emi_df"], check_exact=False, rtol=1e-9, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("mode", ["reset_emi", "reset_tenure"])
+def test_path_totals_match_schedule(mode):
+    resets = [(25, 9.25), (61, 10.0), (97, 7.75)]
+    schedule = floating_rate_schedule(PRINCIPAL, TENURE, RATE, resets, mode=mode)
+    totals = rate_path_totals(
+        PRINCIPAL, TENURE, RATE, [m for m, _ in resets], [r for _, r in resets], mode=mode
+    )
+
+    assert len(schedule) == totals["months"][0]
+    assert schedule["Interest"].sum() == pytest.approx(totals["total_interest"][0], rel=1e-9)
+    assert schedule["Total Payment"].sum() == pytest.approx(totals["total_paid"][0], rel=1e-9)
+    assert schedule["Principal Remaining"].iloc[-1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_fee_arguments_mean_the_same_in_totals_and_schedule():
+    resets = [(25, 9.25), (61, 10.0)]
+    fees = {"upfront_fee": 2_000, "upfront_gst": 360}
+    schedule = floating_rate_schedule(PRINCIPAL, TENURE, RATE, resets, **fees)
+    months, rates = [m for m, _ in resets], [r for _, r in resets]
+    totals = rate_path_totals(PRINCIPAL, TENURE, RATE, months, rates, **fees)
+    no_fee = rate_path_totals(PRINCIPAL, TENURE, RATE, months, rates)
+
+    assert schedule["Total Payment"].sum() == pytest.approx(totals["total_paid"][0], rel=1e-12)
+    assert totals["total_paid"][0] - no_fee["total_paid"][0] == pytest.approx(2_360)
+
+
+def test_rising_rates_raise_emi_or_extend_tenure():
+    months = [13, 25]
+    paths = np.array([[8.5, 8.5], [9.5, 10.5]])
+
+    by_emi = rate_path_totals(PRINCIPAL, TENURE, RATE, months, paths, mode="reset_emi")
+    by_tenure = rate_path_totals(PRINCIPAL, TENURE, RATE, months, paths, mode="reset_tenure")
+
+    assert list(by_emi["months"]) == [TENURE, TENURE]
+    assert by_emi["final_emi"][1] > by_emi["final_emi"][0]
+    assert by_tenure["months"][1] > TENURE
+    assert by_tenure["final_emi"][1] == pytest.approx(by_tenure["final_emi"][0])
+
+
+def test_unsorted_resets_rejected():
+    with pytest.raises(ValueError):
+        rate_path_totals(PRINCIPAL, TENURE, RATE, [25, 13], [9.0, 9.5])
@@ -1,8 +1,14 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from utils.investment import (
     calculate_stepup_sip_inflation_adjusted,
     convert_monthly_to_yearly,
+    sip_final_values,
+    sip_milestones,
+    sip_value_grid,
+    sip_values_at,
 )
 
 
@@ -66,3 +72,98 @@ def test_convert_monthly_to_yearly_uses_last_row_per_year():
     assert yearly.iloc[0]["Inflation Adjusted Amount"] == pytest.approx(
         last_2024["Inflation Adjusted Amount"]
     )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (8_000, 0, 12, 4, 15, 2026),
+        (500, 25, 155, 15, 100, 1960),
+        (200_000, 10, -5, -2, 100, 2060),
+        (1_000, 5, 0, 0, 3, 2024),
+    ],
+)
+def test_numpy_engine_matches_loop(args):
+    expected = calculate_stepup_sip_inflation_adjusted(*args, engine="loop")
+    result = calculate_stepup_sip_inflation_adjusted(*args, engine="numpy")
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-10)
+
+
+def test_unknown_sip_engine():
+    with pytest.raises(ValueError):
+        calculate_stepup_sip_inflation_adjusted(1_000, 0, 12, 4, 1, 2024, engine="fast")
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (8_000, 10, 12, 6, 30, 2026),
+        (500, 25, 155, 15, 100, 1960),
+        (1_000, 5, 0, 3, 10, 2024),
+        (1_000, 5, -6, 6, 10, 2024),  # return + inflation == 0
+    ],
+)
+def test_closed_form_values_match_simulation(args):
+    monthly_df = calculate_stepup_sip_inflation_adjusted(*args, engine="loop")
+    months = np.array([1, 12, 13, 61, len(monthly_df) - 1, len(monthly_df)])
+
+    result = sip_values_at(*args[:4], months, args[5])
+    expected = monthly_df.iloc[months - 1].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+
+def test_values_at_partial_year_when_return_cancels_inflation():
+    # horizon ends mid-year, so the fallback must cover whole years up to it
+    months = np.array([7, 30])
+    monthly_df = calculate_stepup_sip_inflation_adjusted(1_000, 10, -4, 4, 3, 2024, engine="loop")
+
+    result = sip_values_at(1_000, 10, -4, 4, months, 2024)
+    expected = monthly_df.iloc[months - 1].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+
+def test_final_values_near_zero_real_gap_use_the_limit():
+    # return offsets either side of the rho + i ~ 0 cutoff, 100-year horizon
+    returns = np.array([-4.0, -4.0 + 1e-6, -4.0 + 2e-5])
+    real = sip_final_values(8_000, 10, returns, 4, 1_200)["real"]
+
+    for value, annual_return in zip(real, returns):
+        final = calculate_stepup_sip_inflation_adjusted(
+            8_000, 10, annual_return, 4, 100, 2024, engine="loop"
+        ).iloc[-1]
+        assert value == pytest.approx(final["Inflation Adjusted Amount"], rel=1e-11)
+
+
+def test_milestones_every_five_years():
+    milestones = sip_milestones(2_000, 10, 12, 5, 17, 2024)
+    yearly = convert_monthly_to_yearly(
+        calculate_stepup_sip_inflation_adjusted(2_000, 10, 12, 5, 17, 2024)
+    )
+
+    assert list(milestones["Years Completed"]) == [5, 10, 15]
+    assert list(milestones["Year"]) == [2028, 2033, 2038]
+    expected = yearly.set_index("Year").loc[[2028, 2033, 2038], "Nominal Amount"]
+    np.testing.assert_allclose(milestones["Nominal Amount"], expected, rtol=1e-10)
+
+
+def test_value_grid_matches_single_runs():
+    returns = np.linspace(4, 16, 7)
+    stepups = np.array([0.0, 5.0, 10.0])
+    grid = sip_value_grid(
+        5_000, 0, 12, 5, 20, "annual_return_percent", returns, "annual_stepup_percent", stepups
+    )
+
+    assert grid["real"].shape == (7, 3)
+    for r in (0, 6):
+        for c in (0, 2):
+            final = calculate_stepup_sip_inflation_adjusted(
+                5_000, stepups[c], returns[r], 5, 20, 2024, engine="loop"
+            ).iloc[-1]
+            assert grid["real"].iloc[r, c] == pytest.approx(
+                final["Inflation Adjusted Amount"], rel=1e-10
+            )
+            assert grid["nominal"].iloc[r, c] == pytest.approx(final["Nominal Amount"], rel=1e-10)
+
+    with pytest.raises(ValueError):
+        sip_value_grid(5_000, 0, 12, 5, 20, "years", returns, "annual_stepup_percent", stepups)
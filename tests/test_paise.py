@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.paise import compute_paywise_paise, divide_rounded, rounding_rules, to_paise
+
+ARGS = (85000, 15.5, 24, 499, "Fixed", 0, 1500, 0)
+
+
+def test_rounding_rules():
+    assert list(divide_rounded([5, 15, 25, -5], 10, "half_up")) == [1, 2, 3, -1]
+    assert list(divide_rounded([5, 15, 25, -5], 10, "half_even")) == [0, 2, 2, 0]
+    assert list(divide_rounded([5, 15, 25, -5], 10, "floor")) == [0, 1, 2, -1]
+    assert list(to_paise([1.005, 2.675, 0.125], "half_up")) == [101, 268, 13]
+    assert list(to_paise([0.125, 0.135], "half_even")) == [12, 14]
+    with pytest.raises(ValueError):
+        to_paise(1.0, "ceiling")
+
+
+@pytest.mark.parametrize("rounding", ["half_up", "half_even", "floor"])
+def test_paise_schedule_is_exact_and_close_to_float_engine(rounding):
+    data = compute_paywise_paise(*ARGS, rounding=rounding)
+    emi_df = data["emi_df"]
+    totals_paise = data["totals_paise"]
+
+    cents = (emi_df.drop(columns="Month") * 100).to_numpy()
+    assert np.allclose(cents, np.round(cents))
+    assert emi_df["Principal Remaining"].iloc[-1] == 0
+    assert emi_df["Principal Paid"].sum() == pytest.approx(85000, abs=1e-9)
+    assert round(emi_df["Total Payment"].sum() * 100) == totals_paise["total_paid"]
+
+    reference = compute_paywise(*ARGS)["totals"]
+    assert data["totals"]["total_paid"] == pytest.approx(reference["total_paid"], abs=2.0)
+    assert data["totals"]["effective_cost_emi"] == pytest.approx(
+        data["totals"]["total_paid"] - 1500
+    )
+
+
+def test_zero_rate_percentage_fee_financed():
+    data = compute_paywise_paise(10000, 0.0, 3, 100, "Percentage", 0, 0, 0)
+
+    assert data["totals_paise"]["total_interest"] == 0
+    assert data["totals_paise"]["total_paid"] == 1_011_800
+    assert list(data["emi_df"]["EMI"]) == [3372.67, 3372.67, 3372.66]
+
+
+def test_per_component_rounding_keeps_emi_fixed():
+    rounding = {"emi": "floor", "interest": "half_even", "gst": "floor"}
+    data = compute_paywise_paise(*ARGS, rounding=rounding)
+    emi = data["emi_df"]["EMI"]
+
+    assert rounding_rules(rounding)["fee"] == "half_up"
+    assert emi.iloc[:-1].nunique() == 1
+    assert emi.iloc[-1] != emi.iloc[0]
+    assert data["emi_df"]["Principal Remaining"].iloc[-1] == 0
+    assert data["totals_paise"]["total_paid"] != compute_paywise_paise(*ARGS)["totals_paise"][
+        "total_paid"
+    ]
+    with pytest.raises(ValueError):
+        rounding_rules({"principal": "floor"})
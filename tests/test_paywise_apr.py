@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.paywise_apr import offer_cash_flows, solve_offer_apr
+from utils.paywise_batch import offer_arrays
+
+OFFERS = pd.DataFrame({
+    "purchase_amount": [30000, 90000, 120000, 15000],
+    "interest_rate": [14.0, 16.0, 0.0, 24.0],
+    "tenure": [6, 12, 9, 3],
+    "processing_fee_base": [199, 999, 0, 99],
+    "fee_mode": ["Fixed", "Percentage", "Fixed", "Fixed"],
+    "cashback_full": [0, 0, 0, 0],
+    "cashback_emi": [0, 3000, 0, 500],
+    "cashback_nocost": [500, 0, 0, 0],
+})
+
+
+def test_cash_flows_match_schedule_and_effective_cost():
+    arrays = offer_arrays(OFFERS)
+    emi_flows = offer_cash_flows(arrays, "emi")
+    nocost_flows = offer_cash_flows(arrays, "nocost")
+
+    for i, offer in enumerate(OFFERS.to_dict("records")):
+        data = compute_paywise(**offer)
+        expected = data["emi_df"]["Total Payment"].to_numpy().copy()
+        expected[0] -= offer["cashback_emi"]
+        np.testing.assert_allclose(emi_flows[i, : offer["tenure"]], expected, rtol=1e-9)
+        assert emi_flows[i].sum() == pytest.approx(data["totals"]["effective_cost_emi"])
+        assert nocost_flows[i].sum() == pytest.approx(data["totals"]["effective_cost_nocost"])
+
+
+@pytest.mark.parametrize("mode", ["emi", "nocost"])
+def test_irr_discounts_flows_back_to_purchase(mode):
+    result = solve_offer_apr(OFFERS, mode=mode)
+    flows = offer_cash_flows(offer_arrays(OFFERS), mode)
+
+    assert result["converged"].all()
+    assert (result["iterations"] < 20).all()
+    for i, y in enumerate(result["monthly_rate"] / 100):
+        months = np.arange(1, flows.shape[1] + 1)
+        pv = (flows[i] / (1 + y) ** months).sum()
+        assert pv == pytest.approx(OFFERS["purchase_amount"].iloc[i], rel=1e-9)
+
+
+def test_plain_loan_apr_and_unbracketed_offer():
+    plain = pd.DataFrame({"purchase_amount": [50000], "interest_rate": [12.0], "tenure": [12]})
+    # GST on interest puts the true cost above the 12% nominal rate
+    apr = solve_offer_apr(plain)["apr"].iloc[0]
+    assert 12.0 < apr < 12.0 * (1 + 0.18) + 0.5
+
+    free = plain.assign(interest_rate=0.0, cashback_emi=60000.0)
+    result = solve_offer_apr(free, lower=0.0, upper=0.05)
+    assert not result["bracketed"].iloc[0]
+    assert np.isnan(result["apr"].iloc[0])
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.paywise_batch import compute_paywise_batch, paywise_batch_schedules
+
+OFFERS = pd.DataFrame({
+    "purchase_amount": [20000, 150000, 60000, 5000],
+    "interest_rate": [16.0, 0.0, 13.5, 24.0],
+    "tenure": [6, 12, 24, 3],
+    "processing_fee_base": [299, 1500, 0, 99],
+    "fee_mode": ["Fixed", "Percentage", "Fixed", "percentage"],
+    "cashback_full": [0, 1000, 500, 0],
+    "cashback_emi": [250, 0, 70000, 10],
+    "cashback_nocost": [0, 2000, 100, 6000],
+})
+
+
+def test_batch_matches_scalar_compute_paywise():
+    batch = compute_paywise_batch(OFFERS)
+
+    for i, offer in enumerate(OFFERS.to_dict("records")):
+        data = compute_paywise(**offer)
+        row = batch.iloc[i]
+        for key, value in data["totals"].items():
+            assert row[key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+        for key, value in data["averages"].items():
+            assert row[key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+        for mode, block in data["breakdowns"].items():
+            assert row[f"net_total_{mode}"] == pytest.approx(block["net_total"], abs=1e-6)
+            for component, value in block["net"].items():
+                assert row[f"net_{mode}_{component}"] == pytest.approx(value, abs=1e-6)
+
+
+def test_batch_accepts_arrays_and_broadcasts_defaults():
+    batch = compute_paywise_batch({
+        "purchase_amount": 50000,
+        "interest_rate": np.array([12.0, 14.0, 16.0]),
+        "tenure": 12,
+    })
+
+    assert len(batch) == 3
+    assert batch["total_processing_fee"].eq(0).all()
+    assert batch["effective_cost_emi"].is_monotonic_increasing
+
+
+def test_batch_rejects_missing_columns():
+    with pytest.raises(ValueError):
+        compute_paywise_batch({"purchase_amount": [1000]})
+
+
+def test_schedules_only_built_for_requested_rows():
+    schedules = paywise_batch_schedules(OFFERS, rows=[2])
+
+    assert len(schedules) == 1
+    assert len(schedules[0]) == 24
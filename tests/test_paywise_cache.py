@@ -0,0 +1,87 @@
+import pytest
+
+from utils.calculations import schedule_frame
+from utils.paywise_cache import (
+    PaywiseCache,
+    cached_compute_paywise,
+    clear_paywise_cache,
+    paywise_cache_stats,
+)
+
+ARGS = (20000, 16.0, 6, 299, "Fixed", 0, 0, 0)
+
+
+def test_cached_results_count_hits_and_cannot_be_mutated():
+    clear_paywise_cache()
+
+    first = cached_compute_paywise(*ARGS)
+    first["totals"]["total_paid"] = -1
+    first["emi_df"].loc[0, "EMI"] = -1
+
+    second = cached_compute_paywise(20000.0, 16, 6, 299.0, "fixed", 0.0, -0.0, 0)
+
+    assert second["totals"]["total_paid"] > 0
+    assert second["emi_df"].loc[0, "EMI"] > 0
+
+    stats = paywise_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_lru_eviction_and_ttl_expiry():
+    now = [0.0]
+    cache = PaywiseCache(maxsize=2, ttl=10, clock=lambda: now[0])
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.stats().evictions == 1
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert cache.stats().expirations == 1
+
+
+def test_invalid_size_rejected():
+    with pytest.raises(ValueError):
+        PaywiseCache(maxsize=0)
+
+
+def test_cashback_edits_reuse_cached_schedule():
+    clear_paywise_cache()
+
+    base = cached_compute_paywise(*ARGS)
+    edited = cached_compute_paywise(20000, 16.0, 6, 299, "Fixed", 500, 250, 1000)
+
+    stats = paywise_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert edited["totals"]["total_paid"] == pytest.approx(base["totals"]["total_paid"])
+    assert edited["totals"]["effective_cost_emi"] == pytest.approx(
+        base["totals"]["effective_cost_emi"] - 250
+    )
+    assert edited["breakdowns"]["full"]["net_total"] == pytest.approx(19500)
+
+
+def test_lazy_hits_share_a_schedule_but_not_its_frames():
+    clear_paywise_cache()
+
+    first = cached_compute_paywise(*ARGS, lazy=True)
+    second = cached_compute_paywise(*ARGS, lazy=True)
+    first["totals"]["total_paid"] = -1
+    frame = schedule_frame(first["emi_df"])
+    frame["Leak"] = 1
+    frame.drop(columns=["EMI"], inplace=True)
+    frame.loc[0, "Interest"] = -1
+
+    assert second["emi_df"] is first["emi_df"]
+    assert second["totals"]["total_paid"] > 0
+    eager = cached_compute_paywise(*ARGS)["emi_df"]
+    for again in (schedule_frame(second["emi_df"]), second["emi_df"].iloc[0:3], eager):
+        assert "Leak" not in again.columns
+        assert again.loc[0, "EMI"] > 0
+        assert again.loc[0, "Interest"] > 0
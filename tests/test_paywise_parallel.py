@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.paywise_batch import compute_paywise_batch
+from utils.paywise_parallel import compute_paywise_parallel
+
+RNG = np.random.default_rng(7)
+OFFERS = pd.DataFrame({
+    "purchase_amount": RNG.uniform(1_000, 200_000, 41).round(),
+    "interest_rate": RNG.choice([0.0, 11.0, 14.5, 18.0, 24.0], 41),
+    "tenure": RNG.choice([3, 6, 9, 12, 24], 41),
+    "processing_fee_base": RNG.choice([0, 99, 299, 1.5], 41),
+    "fee_mode": RNG.choice(["Fixed", "Percentage"], 41),
+    "cashback_nocost": RNG.uniform(0, 3_000, 41).round(),
+}, index=pd.RangeIndex(100, 141))
+
+
+def test_process_pool_matches_single_process_in_order():
+    expected = compute_paywise_batch(OFFERS)
+    result = compute_paywise_parallel(OFFERS, workers=2, chunk_size=7)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_single_worker_and_bad_chunk_size():
+    expected = compute_paywise_batch(OFFERS)
+    pd.testing.assert_frame_equal(compute_paywise_parallel(OFFERS, workers=1, chunk_size=5), expected)
+
+    with pytest.raises(ValueError):
+        compute_paywise_parallel(OFFERS, chunk_size=0)
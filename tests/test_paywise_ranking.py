@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.paywise_batch import compute_paywise_batch
+from utils.paywise_ranking import rank_offers
+
+RNG = np.random.default_rng(11)
+COUNT = 5_000
+OFFERS = pd.DataFrame({
+    "lender": [f"L{i % 40}" for i in range(COUNT)],
+    "purchase_amount": 60_000.0,
+    "interest_rate": RNG.choice([0.0, 12.0, 14.0, 16.0, 18.0, 21.0], COUNT),
+    "tenure": RNG.choice([3, 6, 9, 12, 18, 24], COUNT),
+    "processing_fee_base": RNG.choice([0, 199, 499, 999], COUNT),
+    "fee_mode": "Fixed",
+    "cashback_emi": RNG.uniform(0, 2_500, COUNT).round(),
+    "cashback_nocost": RNG.uniform(0, 2_500, COUNT).round(),
+})
+
+
+@pytest.mark.parametrize("mode", ["emi", "nocost", "full"])
+def test_top_k_matches_full_sort(mode):
+    ranked = rank_offers(OFFERS, k=10, mode=mode, block_size=64)
+    costs = compute_paywise_batch(OFFERS)[f"effective_cost_{mode}"]
+    expected = costs.sort_values(kind="stable").head(10)
+
+    assert list(ranked.index) == list(expected.index)
+    np.testing.assert_allclose(ranked["effective_cost"], expected.to_numpy())
+    assert (ranked["lower_bound"] <= ranked["effective_cost"] + 1e-9).all()
+    assert list(ranked["rank"]) == list(range(1, 11))
+
+
+def test_pruning_skips_most_offers():
+    ranked = rank_offers(OFFERS, k=5, mode="emi", block_size=128)
+
+    assert ranked.attrs["evaluated"] < COUNT / 2
+
+
+def test_k_larger_than_catalogue_and_bad_mode():
+    small = OFFERS.head(3)
+    assert len(rank_offers(small, k=10)) == 3
+
+    with pytest.raises(ValueError):
+        rank_offers(small, mode="bnpl")
@@ -0,0 +1,62 @@
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.paywise_batch import compute_paywise_batch
+from utils.paywise_sensitivity import paywise_deltas, paywise_sensitivities
+
+BASE = {
+    "purchase_amount": 75000,
+    "interest_rate": 15.0,
+    "tenure": 12,
+    "processing_fee_base": 400,
+    "fee_mode": "Percentage",
+    "cashback_full": 0,
+    "cashback_emi": 0,
+    "cashback_nocost": 0,
+}
+
+
+@pytest.mark.parametrize("fee_mode", ["Fixed", "Percentage"])
+@pytest.mark.parametrize("rate", [0.0, 15.0])
+@pytest.mark.parametrize("lever", ["interest_rate", "tenure", "processing_fee_base"])
+def test_partials_match_central_differences(lever, rate, fee_mode):
+    base = dict(BASE, interest_rate=rate, fee_mode=fee_mode)
+    step = 1e-4
+    offers = {name: [value, value] for name, value in base.items()}
+    offers[lever] = [base[lever] - step, base[lever] + step]
+    if lever == "interest_rate" and rate == 0.0:
+        offers[lever] = [0.0, step]
+        step = step / 2
+
+    low, high = compute_paywise_batch(offers).to_dict("records")
+    partials = paywise_sensitivities(
+        base["purchase_amount"],
+        base["interest_rate"],
+        base["tenure"],
+        base["processing_fee_base"],
+        base["fee_mode"],
+    )[lever]
+
+    for metric in ("effective_cost_emi", "avg_monthly_outflow", "effective_cost_nocost"):
+        numeric = (high[metric] - low[metric]) / (2 * step)
+        assert float(partials[metric]) == pytest.approx(numeric, rel=1e-4, abs=1e-4)
+
+
+def test_deltas_match_recomputed_scenarios():
+    deltas = {"interest_rate": [0.5, -1.0], "tenure": [1], "cashback_emi": [500]}
+    frame = paywise_deltas(deltas=deltas, **BASE)
+
+    assert list(frame["lever"]) == ["interest_rate", "interest_rate", "tenure", "cashback_emi"]
+
+    base = compute_paywise(**BASE)["totals"]
+    variant = compute_paywise(**dict(BASE, tenure=13))["totals"]
+    tenure_row = frame.iloc[2]
+    assert tenure_row["effective_cost_emi"] == pytest.approx(
+        variant["effective_cost_emi"] - base["effective_cost_emi"], abs=1e-6
+    )
+    assert frame.iloc[3]["effective_cost_emi"] == pytest.approx(-500)
+
+
+def test_unknown_lever_rejected():
+    with pytest.raises(ValueError):
+        paywise_deltas(deltas=[("purchase_price", 1)], **BASE)
@@ -0,0 +1,56 @@
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.prepayment import evaluate_prepayment_plans, prepayment_schedule
+
+PRINCIPAL, RATE, TENURE = 500000, 10.5, 60
+
+PLANS = [
+    [],
+    [(12, 100000, "reduce_emi")],
+    [(12, 100000, "reduce_tenure"), (24, 50000, "reduce_emi")],
+    [(6, 10_000_000, "reduce_tenure")],
+]
+
+
+def test_plan_totals_match_materialized_schedules():
+    totals = evaluate_prepayment_plans(PRINCIPAL, RATE, TENURE, PLANS)
+
+    for i, plan in enumerate(PLANS):
+        schedule = prepayment_schedule(PRINCIPAL, RATE, TENURE, plan)
+        row = totals.iloc[i]
+        assert len(schedule) == row["months"]
+        assert schedule["Interest"].sum() == pytest.approx(row["total_interest"], abs=1e-6)
+        assert schedule["Total Payment"].sum() == pytest.approx(row["total_paid"], abs=1e-6)
+        assert schedule["Principal Paid"].sum() + schedule["Prepayment"].sum() == pytest.approx(
+            PRINCIPAL
+        )
+        assert schedule["Principal Remaining"].iloc[-1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_no_events_reproduces_base_schedule():
+    base = compute_paywise(PRINCIPAL, RATE, TENURE, 0, "Fixed", 0, 0, 0)
+    totals = evaluate_prepayment_plans(PRINCIPAL, RATE, TENURE, [[]]).iloc[0]
+
+    assert totals["total_paid"] == pytest.approx(base["totals"]["total_paid"])
+    assert totals["interest_saved"] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_reduce_modes_trade_emi_for_tenure():
+    totals = evaluate_prepayment_plans(
+        PRINCIPAL,
+        RATE,
+        TENURE,
+        [[(12, 100000, "reduce_emi")], [(12, 100000, "reduce_tenure")]],
+    )
+    lower_emi, shorter = totals.iloc[0], totals.iloc[1]
+
+    assert lower_emi["months"] == TENURE
+    assert lower_emi["final_emi"] < shorter["final_emi"]
+    assert shorter["months_saved"] > 0
+    assert shorter["interest_saved"] > lower_emi["interest_saved"] > 0
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        evaluate_prepayment_plans(PRINCIPAL, RATE, TENURE, [[(3, 1000, "skip_emi")]])
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from utils.calculations import compute_paywise
+from utils.rate_simulation import simulate_floating_costs
+
+LOAN = {"principal": 3_000_000, "tenure": 240, "initial_rate": 8.75}
+
+
+def test_seeded_runs_are_reproducible_across_chunk_sizes():
+    first = simulate_floating_costs(n_paths=1_000, seed=7, chunk_size=1_000, **LOAN)
+    second = simulate_floating_costs(n_paths=1_000, seed=7, chunk_size=128, **LOAN)
+
+    pd.testing.assert_frame_equal(first["percentiles"], second["percentiles"])
+    assert first["percentiles"]["total_paid"].is_monotonic_increasing
+
+
+def test_zero_volatility_collapses_to_fixed_rate_cost():
+    result = simulate_floating_costs(
+        n_paths=50,
+        volatility=0.0,
+        seed=1,
+        cashback=5_000,
+        upfront_fee=1_000,
+        upfront_gst=180,
+        **LOAN,
+    )
+    fixed = compute_paywise(3_000_000, 8.75, 240, 1_000, "Fixed", 0, 5_000, 0)["totals"]
+
+    band = result["percentiles"]
+    assert band["total_paid"].iloc[0] == pytest.approx(fixed["total_paid"], rel=1e-9)
+    assert band["effective_cost"].iloc[-1] == pytest.approx(
+        fixed["effective_cost_emi"], rel=1e-9
+    )
+    assert band["total_gst_interest"].iloc[3] == pytest.approx(
+        fixed["total_gst_interest"], rel=1e-9
+    )
+
+
+def test_invalid_sizes_rejected():
+    with pytest.raises(ValueError):
+        simulate_floating_costs(n_paths=0, **LOAN)
@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+from score_offers import main, score_file
+from utils.calculations import compute_paywise
+
+OFFERS = pd.DataFrame({
+    "purchase_amount": [20000, 150000, 60000, 5000, 80000],
+    "interest_rate": [16.0, 0.0, 13.5, 24.0, 11.0],
+    "tenure": [6, 12, 24, 3, 9],
+    "processing_fee_base": [299, 1500, 0, 99, 0],
+    "fee_mode": ["Fixed", "Percentage", "Fixed", "Fixed", "Fixed"],
+    "cashback_full": [0, 1000, 500, 0, 0],
+    "cashback_emi": [250, 0, 70000, 10, 0],
+    "cashback_nocost": [0, 2000, 100, 6000, 4000],
+})
+
+
+def test_streams_chunks_into_one_csv(tmp_path):
+    source = tmp_path / "offers.csv"
+    target = tmp_path / "scored.csv"
+    OFFERS.to_csv(source, index=False)
+
+    stats = score_file(source, target, chunk_size=2)
+    scored = pd.read_csv(target)
+
+    assert stats["rows"] == len(OFFERS)
+    assert list(scored.columns[: len(OFFERS.columns)]) == list(OFFERS.columns)
+    for i, offer in enumerate(OFFERS.to_dict("records")):
+        totals = compute_paywise(**offer)["totals"]
+        costs = {
+            "Full Payment": totals["effective_cost_full"],
+            "Regular EMI": totals["effective_cost_emi"],
+            "No-Cost EMI": totals["effective_cost_nocost"],
+        }
+        assert scored["effective_cost_emi"].iloc[i] == pytest.approx(costs["Regular EMI"])
+        assert scored["best_mode"].iloc[i] == min(costs, key=costs.get)
+        assert scored["best_cost"].iloc[i] == pytest.approx(min(costs.values()))
+
+
+def test_cli_reports_throughput(tmp_path, capsys):
+    source = tmp_path / "offers.csv"
+    OFFERS.to_csv(source, index=False)
+
+    assert main([str(source), str(tmp_path / "out.csv"), "--chunk-size", "3"]) == 0
+    assert "rows/s" in capsys.readouterr().err
+
+
+def test_workers_give_same_output(tmp_path):
+    source = tmp_path / "offers.csv"
+    OFFERS.to_csv(source, index=False)
+
+    score_file(source, tmp_path / "serial.csv", chunk_size=3)
+    score_file(source, tmp_path / "parallel.csv", chunk_size=3, workers=2)
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "parallel.csv"), pd.read_csv(tmp_path / "serial.csv")
+    )
+
+
+def test_parquet_output_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "offers.csv"
+    OFFERS.to_csv(source, index=False)
+
+    score_file(source, tmp_path / "scored.csv", chunk_size=2)
+    score_file(source, tmp_path / "scored.parquet", chunk_size=2)
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "scored.parquet"), pd.read_csv(tmp_path / "scored.csv")
+    )
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from utils.investment import sip_final_values
+from utils.sip_goal import required_monthly_sip, required_stepup, required_years
+
+
+def test_required_sip_hits_target():
+    sip = float(required_monthly_sip(1e7, 10, 12, 6, 15))
+    final = sip_final_values(sip, 10, 12, 6, 180)["real"]
+
+    assert final == pytest.approx(1e7, rel=1e-12)
+    nominal_sip = required_monthly_sip(np.array([1e6, 1e7]), 0, 12, 6, 15, value="nominal")
+    assert nominal_sip[1] == pytest.approx(10 * nominal_sip[0])
+
+
+def test_required_stepup_is_vectorized_and_flags_unreachable():
+    targets = np.array([5e6, 1e7, 1e12])
+    stepups = required_stepup(targets, 10_000, 12, 6, 15)
+
+    for target, stepup in zip(targets[:2], stepups[:2]):
+        assert sip_final_values(10_000, stepup, 12, 6, 180)["real"] == pytest.approx(target, rel=1e-6)
+    assert np.isnan(stepups[2])
+    # already met with no step-up
+    assert required_stepup(1e5, 10_000, 12, 6, 15) == 0.0
+
+
+def test_required_years_is_first_year_reaching_target():
+    years = float(required_years(1e7, 20_000, 5, 12, 6))
+    finals = [float(sip_final_values(20_000, 5, 12, 6, y * 12)["real"]) for y in (years - 1, years)]
+
+    assert finals[0] < 1e7 <= finals[1]
+    assert np.isnan(required_years(1e15, 1_000, 0, 8, 6, max_years=40))
+    with pytest.raises(ValueError):
+        required_years(1e6, 1_000, 0, 8, 6, value="gross")
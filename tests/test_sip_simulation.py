@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.investment import sip_values_at
+from utils.sip_simulation import simulate_sip_outcomes
+
+PLAN = {
+    "monthly_sip": 8_000,
+    "annual_stepup_percent": 10,
+    "annual_return_percent": 12,
+    "annual_inflation_percent": 5,
+    "years": 15,
+    "start_year": 2026,
+}
+
+
+def test_seeded_runs_are_reproducible_across_chunk_sizes():
+    first = simulate_sip_outcomes(n_paths=600, seed=3, chunk_size=600, target=5e6, **PLAN)
+    second = simulate_sip_outcomes(n_paths=600, seed=3, chunk_size=77, target=5e6, **PLAN)
+
+    pd.testing.assert_frame_equal(first["bands"], second["bands"])
+    assert first["probability"] == second["probability"]
+    bands = first["bands"]
+    assert (bands["Real P10"] <= bands["Real P50"]).all()
+    assert (bands["Real P50"] <= bands["Real P90"]).all()
+
+
+def test_zero_volatility_collapses_to_deterministic_values():
+    result = simulate_sip_outcomes(
+        n_paths=20, return_volatility=0.0, inflation_volatility=0.0, seed=1, **PLAN
+    )
+    expected = sip_values_at(
+        8_000, 10, 12, 5, result["bands"]["Month Index"].to_numpy(), 2026
+    )
+
+    assert list(result["bands"]["Year"]) == list(expected["Year"])
+    for band in ("P10", "P50", "P90"):
+        np.testing.assert_allclose(
+            result["bands"][f"Nominal {band}"], expected["Nominal Amount"], rtol=1e-10
+        )
+        np.testing.assert_allclose(
+            result["bands"][f"Real {band}"], expected["Inflation Adjusted Amount"], rtol=1e-10
+        )
+
+
+def test_target_probability_bounds():
+    final = sip_values_at(8_000, 10, 12, 5, [180], 2026)["Inflation Adjusted Amount"].iloc[0]
+    flat = dict(n_paths=50, return_volatility=0.0, inflation_volatility=0.0, **PLAN)
+
+    assert simulate_sip_outcomes(target=final * 0.99, **flat)["probability"] == 1.0
+    assert simulate_sip_outcomes(target=final * 1.01, **flat)["probability"] == 0.0
+    with pytest.raises(ValueError):
+        simulate_sip_outcomes(n_paths=0, **PLAN)
@@ -0,0 +1,237 @@
+"""
+Precomputed annuity factors for the sidebar input grid.
+
+    python -m utils.annuity_table [path]
+    python -m utils.annuity_table --bench
+
+writes the table (or times gathers against the exact formula). Nothing
+is built or loaded on import: callers opt in with load_annuity_table,
+which memory-maps the file so every process on the machine shares one
+copy through the page cache. The table serves vectorized gathers by grid
+index, falling back to the exact formula for positions off the grid;
+calculate_emi always computes exactly.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from utils.calculations import GST_RATE
+
+RATE_STEP = 0.05
+MAX_RATE = 40.0
+MIN_TENURE = 3
+MAX_TENURE = 360
+
+# per rupee of principal: (1+r)^n, EMI, total interest, GST on interest
+ANNUITY_TABLE_FIELDS = ("growth", "emi", "interest", "gst")
+
+# bump when the formulas change so existing files are rebuilt
+ANNUITY_TABLE_VERSION = 1
+
+DEFAULT_TABLE_PATH = Path(
+    os.environ.get(
+        "PAYWISE_ANNUITY_TABLE",
+        Path(tempfile.gettempdir()) / "paywise_annuity_table.npy",
+    )
+)
+
+
+def _grid():
+    rates = np.arange(round(MAX_RATE / RATE_STEP) + 1) * RATE_STEP
+    tenures = np.arange(MIN_TENURE, MAX_TENURE + 1)
+    return rates, tenures
+
+
+def table_metadata() -> dict:
+    """Grid parameters and version a table file must match to be reused."""
+    return {
+        "version": ANNUITY_TABLE_VERSION,
+        "rate_step": RATE_STEP,
+        "max_rate": MAX_RATE,
+        "min_tenure": MIN_TENURE,
+        "max_tenure": MAX_TENURE,
+        "gst_rate": GST_RATE,
+        "fields": list(ANNUITY_TABLE_FIELDS),
+    }
+
+
+def _metadata_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.json")
+
+
+def _exact_factors(annual_rates, tenures) -> np.ndarray:
+    """
+    Per-rupee factors (stacked in ANNUITY_TABLE_FIELDS order) for
+    broadcastable arrays of annual rates (%) and tenures, from the formula.
+    """
+    r = np.asarray(annual_rates, dtype=float) / 12 / 100
+    n = np.asarray(tenures, dtype=float)
+    log_growth = n * np.log1p(r)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        emi = np.where(r == 0, 1 / n, r / -np.expm1(-log_growth))
+    interest = np.where(r == 0, 0.0, n * emi - 1)
+    return np.stack([np.exp(log_growth), emi, interest, interest * GST_RATE])
+
+
+def build_annuity_table() -> np.ndarray:
+    """
+    (fields x rates x tenures) float64 array of per-rupee factors for
+    every rate 0-40% in 0.05 steps and tenure 3-360 months.
+    """
+    rates, tenures = _grid()
+    return _exact_factors(rates[:, None], tenures[None, :])
+
+
+def write_annuity_table(path=DEFAULT_TABLE_PATH) -> Path:
+    """
+    Build the table and save it as .npy with a .npy.json sidecar holding
+    table_metadata(). Both are replaced atomically, metadata last, so an
+    interrupted write never looks current.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as handle:
+        np.save(handle, build_annuity_table())
+    os.replace(partial, path)
+
+    metadata_path = _metadata_path(path)
+    partial = metadata_path.with_name(f"{metadata_path.name}.{os.getpid()}.tmp")
+    partial.write_text(json.dumps(table_metadata()), encoding="utf-8")
+    os.replace(partial, metadata_path)
+    return path
+
+
+class AnnuityTable:
+    """
+    O(1) lookups into a (memory-mapped) factor table. `factors` returns
+    None for inputs that are not exactly on the grid.
+    """
+
+    def __init__(self, values: np.ndarray):
+        rates, tenures = _grid()
+        expected = (len(ANNUITY_TABLE_FIELDS), len(rates), len(tenures))
+        if values.shape != expected:
+            raise ValueError(f"Annuity table has shape {values.shape}; expected {expected}")
+        self.values = values
+
+    def _position(self, annual_rate, months):
+        step = round(annual_rate / RATE_STEP)
+        if not 0 <= step * RATE_STEP <= MAX_RATE or abs(step * RATE_STEP - annual_rate) > 1e-9:
+            return None
+        if months != int(months) or not MIN_TENURE <= months <= MAX_TENURE:
+            return None
+        return step, int(months) - MIN_TENURE
+
+    def factors(self, annual_rate, months):
+        """(growth, emi, interest, gst) per rupee, or None off-grid."""
+        position = self._position(annual_rate, months)
+        if position is None:
+            return None
+        return tuple(float(v) for v in self.values[(slice(None),) + position])
+
+    def gather(self, rate_steps, tenures, field="emi"):
+        """
+        Factors for arrays of grid positions: rate index (rate / RATE_STEP)
+        and tenure in months. One gather replaces an expm1/log1p per item;
+        positions off the grid (fractional, negative or past its edges) are
+        computed exactly instead.
+        """
+        field_index = ANNUITY_TABLE_FIELDS.index(field)
+        plane = self.values[field_index]
+        rate_steps, tenures = np.broadcast_arrays(np.asarray(rate_steps), np.asarray(tenures))
+        shape = rate_steps.shape
+        rate_steps, tenures = rate_steps.ravel(), tenures.ravel()
+        on_grid = (
+            (rate_steps >= 0)
+            & (rate_steps < plane.shape[0])
+            & (tenures >= MIN_TENURE)
+            & (tenures <= MAX_TENURE)
+        )
+        integral = np.issubdtype(rate_steps.dtype, np.integer) and np.issubdtype(
+            tenures.dtype, np.integer
+        )
+        if not integral:
+            on_grid &= (rate_steps == np.round(rate_steps)) & (tenures == np.round(tenures))
+
+        flat = (rate_steps * plane.shape[1] + (tenures - MIN_TENURE)).astype(np.intp)
+        if on_grid.all():
+            return plane.reshape(-1)[flat].reshape(shape)
+
+        off = ~on_grid
+        flat[off] = 0
+        factors = plane.reshape(-1)[flat]
+        factors[off] = _exact_factors(rate_steps[off] * RATE_STEP, tenures[off])[field_index]
+        return factors.reshape(shape)
+
+
+def _open_table(path: Path) -> AnnuityTable:
+    try:
+        metadata = json.loads(_metadata_path(path).read_text(encoding="utf-8"))
+        values = np.load(path, mmap_mode="r")
+    except (OSError, EOFError, ValueError) as exc:
+        raise ValueError(f"Unreadable annuity table at {path}: {exc}") from exc
+    if metadata != table_metadata():
+        raise ValueError(f"Annuity table at {path} was built for a different grid or version")
+    return AnnuityTable(values)
+
+
+def load_annuity_table(path=DEFAULT_TABLE_PATH, build=True) -> AnnuityTable:
+    """
+    Memory-map the table at `path`. A missing, unreadable or stale file
+    (metadata not matching table_metadata()) is rebuilt when `build` is
+    set, otherwise ValueError is raised.
+    """
+    path = Path(path)
+    try:
+        return _open_table(path)
+    except ValueError:
+        if not build:
+            raise
+    write_annuity_table(path)
+    return _open_table(path)
+
+
+def benchmark_gather(count=1_000_000, repeats=10, seed=0) -> dict:
+    """
+    Seconds per call for `count` EMI factors: table gather by grid index
+    against the exact expm1/log1p formula on the same inputs.
+    """
+    rng = np.random.default_rng(seed)
+    rates, tenures = _grid()
+    steps = rng.integers(0, len(rates), count)
+    months = rng.choice(tenures, count)
+    table = AnnuityTable(build_annuity_table())
+
+    def exact():
+        r = rates[steps] / 12 / 100
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(r == 0, 1 / months, r / -np.expm1(-months * np.log1p(r)))
+
+    timings = {}
+    for name, run in (("gather", lambda: table.gather(steps, months)), ("exact", exact)):
+        run()
+        started = time.perf_counter()
+        for _ in range(repeats):
+            run()
+        timings[name] = (time.perf_counter() - started) / repeats
+    return timings
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        timings = benchmark_gather()
+        print(
+            f"1M EMI factors: gather {timings['gather'] * 1e3:.1f} ms, "
+            f"exact {timings['exact'] * 1e3:.1f} ms"
+        )
+    else:
+        target = write_annuity_table(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_PATH)
+        print(f"Wrote {target} ({target.stat().st_size / 1e6:.1f} MB)")
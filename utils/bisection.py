@@ -0,0 +1,41 @@
+import numpy as np
+
+
+def bisect_roots(gap, lower, upper, tol=1e-6, max_iter=100) -> dict:
+    """
+    Vectorized bisection: for every element, a root of `gap` (a function
+    of an array of candidate values) in [lower, upper]. All elements are
+    evaluated together on each iteration; an element stops once its
+    bracket is narrower than `tol`.
+
+    Returns {"root", "bracketed", "converged", "iterations"}. Elements
+    whose bracket shows no sign change get root NaN and bracketed=False.
+    """
+    lo, hi = np.broadcast_arrays(np.asarray(lower, dtype=float), np.asarray(upper, dtype=float))
+    lo = lo.copy()
+    hi = hi.copy()
+
+    gap_lo = gap(lo)
+    bracketed = np.sign(gap_lo) * np.sign(gap(hi)) <= 0
+
+    iterations = np.zeros(lo.shape, dtype=int)
+    active = bracketed & (hi - lo > tol)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        mid = (lo + hi) / 2
+        gap_mid = gap(mid)
+        go_left = np.sign(gap_mid) * np.sign(gap_lo) <= 0
+
+        hi = np.where(active & go_left, mid, hi)
+        lo = np.where(active & ~go_left, mid, lo)
+        gap_lo = np.where(active & ~go_left, gap_mid, gap_lo)
+        iterations += active
+        active = active & (hi - lo > tol)
+
+    return {
+        "root": np.where(bracketed, (lo + hi) / 2, np.nan),
+        "bracketed": bracketed,
+        "converged": bracketed & ~active,
+        "iterations": iterations,
+    }
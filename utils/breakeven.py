@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from utils.bisection import bisect_roots
+from utils.paywise_batch import PAYMENT_MODES, effective_costs, offer_arrays
+
+BREAK_EVEN_VARIABLES = [
+    "interest_rate",
+    "tenure",
+    "processing_fee_base",
+    "cashback_full",
+    "cashback_emi",
+    "cashback_nocost",
+]
+
+
+def _default_bracket(variable, arrays):
+    purchase = arrays["purchase_amount"]
+    if variable == "interest_rate":
+        return np.zeros_like(purchase), np.full_like(purchase, 100.0)
+    if variable == "tenure":
+        return np.ones_like(purchase), np.full_like(purchase, 600.0)
+    if variable == "processing_fee_base":
+        return np.zeros_like(purchase), purchase.copy()
+    # cashbacks: allow discounts up to twice the purchase in either direction
+    return -2 * purchase, 2 * purchase
+
+
+def solve_break_even(
+    offers,
+    variable: str,
+    mode_a: str = "nocost",
+    mode_b: str = "full",
+    lower=None,
+    upper=None,
+    tol: float = 1e-6,
+    max_iter: int = 200,
+) -> pd.DataFrame:
+    """
+    For every offer, find the value of `variable` at which `mode_a` and
+    `mode_b` ("full", "emi", "nocost") cost the same.
+
+    Vectorized bisection over the closed-form batch evaluator: every
+    iteration re-prices all offers at once. Offers whose [lower, upper]
+    bracket shows no sign change get NaN and bracketed=False. Tenure is
+    solved as a continuous month count.
+    """
+    if variable not in BREAK_EVEN_VARIABLES:
+        raise ValueError(f"Unknown variable {variable!r}; expected one of {BREAK_EVEN_VARIABLES}")
+    for mode in (mode_a, mode_b):
+        if mode not in PAYMENT_MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {PAYMENT_MODES}")
+
+    arrays = offer_arrays(offers)
+    default_lower, default_upper = _default_bracket(variable, arrays)
+    lo = np.broadcast_to(default_lower if lower is None else lower, default_lower.shape)
+    hi = np.broadcast_to(default_upper if upper is None else upper, default_upper.shape)
+
+    def gap(values):
+        costs = effective_costs({**arrays, variable: values})
+        return costs[mode_a] - costs[mode_b]
+
+    solved = bisect_roots(gap, lo, hi, tol=tol, max_iter=max_iter)
+    solution = solved["root"]
+    bracketed = solved["bracketed"]
+    residual = np.where(bracketed, gap(np.where(bracketed, solution, lo)), np.nan)
+
+    index = offers.index if isinstance(offers, pd.DataFrame) else None
+    return pd.DataFrame(
+        {
+            "break_even": solution,
+            "bracketed": bracketed,
+            "converged": solved["converged"],
+            "iterations": solved["iterations"],
+            "residual": residual,
+        },
+        index=index,
+    )
@@ -1,3 +1,6 @@
+import math
+
+import numpy as np
 import pandas as pd
 
 GST_RATE = 0.18
@@ -7,10 +10,164 @@ GST_RATE = 0.18
 # EMI formula (unchanged)
 # -------------------------------------------------
 def calculate_emi(principal, annual_rate, months):
+    r = annual_rate / 12 / 100
+    # P * r * (1+r)^n / ((1+r)^n - 1), written to stay exact for tiny r
+    vector = (np.ndarray, pd.Series)
+    if not isinstance(r, vector) and not isinstance(months, vector):
+        if r == 0:
+            return principal / months
+        return principal * r / -math.expm1(-months * math.log1p(r))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        emi = principal * r / -np.expm1(-months * np.log1p(r))
+    return np.where(r == 0, principal / months, emi)
+
+
+# -------------------------------------------------
+# Closed-form schedule queries (no schedule built)
+# -------------------------------------------------
+def balance_after(principal, annual_rate, months, k):
+    """
+    Principal outstanding after `k` EMIs (vectorized over arrays of k).
+    Uses B(k) = P * ((1+r)^n - (1+r)^k) / ((1+r)^n - 1).
+    """
+    k = np.clip(np.asarray(k, dtype=float), 0, months)
     r = annual_rate / 12 / 100
     if r == 0:
-        return principal / months
-    return principal * r * (1 + r) ** months / ((1 + r) ** months - 1)
+        return principal * (months - k) / months
+    log_growth = np.log1p(r)
+    grown_n = np.expm1(months * log_growth)
+    return principal * (grown_n - np.expm1(k * log_growth)) / grown_n
+
+
+def cumulative_interest(principal, annual_rate, months, k):
+    """
+    Interest paid over the first `k` EMIs: k * EMI - (P - B(k)).
+    """
+    k = np.clip(np.asarray(k, dtype=float), 0, months)
+    if annual_rate == 0:
+        return np.zeros_like(k)
+    emi = calculate_emi(principal, annual_rate, months)
+    return k * emi - (principal - balance_after(principal, annual_rate, months, k))
+
+
+def cumulative_gst(principal, annual_rate, months, k):
+    return cumulative_interest(principal, annual_rate, months, k) * GST_RATE
+
+
+def interest_between(principal, annual_rate, months, start, end):
+    """
+    Interest paid in months `start`..`end` (1-based, inclusive).
+    """
+    start = np.asarray(start)
+    return (
+        cumulative_interest(principal, annual_rate, months, end)
+        - cumulative_interest(principal, annual_rate, months, start - 1)
+    )
+
+
+def gst_between(principal, annual_rate, months, start, end):
+    return interest_between(principal, annual_rate, months, start, end) * GST_RATE
+
+
+def principal_paid_between(principal, annual_rate, months, start, end):
+    """
+    Principal repaid in months `start`..`end` (1-based, inclusive).
+    """
+    start = np.asarray(start)
+    return (
+        balance_after(principal, annual_rate, months, start - 1)
+        - balance_after(principal, annual_rate, months, end)
+    )
+
+
+# -------------------------------------------------
+# Segment annuity helpers (vectorized, monthly rates)
+# -------------------------------------------------
+def annuity_payment(balance, monthly_rate, months):
+    """
+    EMI that clears `balance` in `months` payments (calculate_emi over arrays).
+    """
+    balance, monthly_rate, months = np.broadcast_arrays(
+        np.asarray(balance, dtype=float),
+        np.asarray(monthly_rate, dtype=float),
+        np.asarray(months, dtype=float),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            monthly_rate == 0,
+            balance / months,
+            balance * monthly_rate / -np.expm1(-months * np.log1p(monthly_rate)),
+        )
+
+
+def annuity_balance(balance, monthly_rate, emi, months):
+    """
+    Balance left after `months` payments of `emi` starting from `balance`:
+    B * (1+r)^m - EMI * ((1+r)^m - 1) / r.
+    """
+    balance, monthly_rate, emi, months = np.broadcast_arrays(
+        np.asarray(balance, dtype=float),
+        np.asarray(monthly_rate, dtype=float),
+        np.asarray(emi, dtype=float),
+        np.asarray(months, dtype=float),
+    )
+    grown = np.expm1(months * np.log1p(monthly_rate))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(monthly_rate == 0, months, grown / monthly_rate)
+    return balance + balance * grown - emi * factor
+
+
+def annuity_term(balance, monthly_rate, emi):
+    """
+    (Fractional) number of `emi` payments needed to clear `balance`;
+    inf when the EMI doesn't cover the interest.
+    """
+    balance, monthly_rate, emi = np.broadcast_arrays(
+        np.asarray(balance, dtype=float),
+        np.asarray(monthly_rate, dtype=float),
+        np.asarray(emi, dtype=float),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covered = 1 - balance * monthly_rate / emi
+        term = np.where(
+            monthly_rate == 0,
+            balance / emi,
+            -np.log(covered) / np.log1p(monthly_rate),
+        )
+        term = np.where((monthly_rate > 0) & (covered <= 0), np.inf, term)
+    return np.where(balance <= 0, 0.0, term)
+
+
+def annuity_payoff(balance, monthly_rate, emi):
+    """
+    Pay `balance` off with `emi` instalments and a smaller final one.
+    Returns (payments, total_paid): whole months used and cash paid.
+    """
+    term = annuity_term(balance, monthly_rate, emi)
+    full_payments = np.maximum(np.ceil(term - 1e-9) - 1, 0)
+    last_payment = annuity_balance(balance, monthly_rate, emi, full_payments) * (1 + monthly_rate)
+    paying = np.asarray(balance) > 0
+    payments = np.where(paying, full_payments + 1, 0)
+    total_paid = np.where(paying, full_payments * emi + last_payment, 0.0)
+    return payments, total_paid
+
+
+def annuity_segment(balance, monthly_rate, emi, months):
+    """
+    Per-month arrays for `months` payments of `emi` on `balance` at a fixed
+    rate: opening balance, interest and principal paid. The last payment
+    is capped at what is owed.
+    """
+    steps = np.arange(months)
+    opening = annuity_balance(balance, monthly_rate, emi, steps)
+    interest = opening * monthly_rate
+    principal_paid = np.minimum(emi - interest, opening)
+    return {
+        "opening": opening,
+        "interest": interest,
+        "principal_paid": principal_paid,
+    }
 
 
 # -------------------------------------------------
@@ -46,33 +203,86 @@ def apply_cashback_to_components(components: dict, cashback: float) -> dict:
     return adjusted
 
 
-# -------------------------------------------------
-# Unified calculation engine
-# -------------------------------------------------
-def compute_paywise(
-    purchase_amount: float,
-    interest_rate: float,
-    tenure: int,
-    processing_fee_base: float,
-    fee_mode: str,
-    cashback_full: float,
-    cashback_emi: float,
-    cashback_nocost: float
+CASHBACK_ORDER = ("principal", "interest", "tax", "fee")
+
+
+def apply_cashback_to_component_arrays(components: dict, cashback) -> dict:
+    """
+    Array form of apply_cashback_to_components: the same waterfall for
+    many offers at once, from cumulative sums and clipping.
+    """
+    *values, cashback = np.broadcast_arrays(
+        *(np.asarray(components.get(key, 0.0), dtype=float) for key in CASHBACK_ORDER),
+        np.asarray(cashback, dtype=float),
+    )
+    values = np.stack(values)
+    available = np.maximum(values, 0.0)
+    consumed_before = np.cumsum(available, axis=0) - available
+    reduction = np.minimum(available, np.maximum(np.maximum(cashback, 0.0) - consumed_before, 0.0))
+    net = values - reduction
+    net = np.where(net < 1e-9, 0.0, net)
+    return dict(zip(CASHBACK_ORDER, net))
+
+
+def net_breakdown_arrays(
+    purchase_amount,
+    total_interest,
+    total_gst_interest,
+    total_fee_with_gst,
+    cashback_full,
+    cashback_emi,
+    cashback_nocost,
 ) -> dict:
+    """
+    Net components and net total per payment mode for arrays of offers:
+    {"full" | "emi" | "nocost": {"net": {component: array}, "net_total": array}}.
+    """
+    zeros = np.zeros_like(np.asarray(purchase_amount, dtype=float))
+    gross = {
+        "full": {"principal": purchase_amount},
+        "emi": {
+            "principal": purchase_amount,
+            "interest": total_interest,
+            "tax": total_gst_interest,
+            "fee": total_fee_with_gst,
+        },
+        "nocost": {
+            "principal": purchase_amount,
+            "tax": total_gst_interest,
+            "fee": total_fee_with_gst,
+        },
+    }
+    cashbacks = {"full": cashback_full, "emi": cashback_emi, "nocost": cashback_nocost}
 
-    processing_fee_base = max(float(processing_fee_base), 0.0)
-    processing_fee_gst = processing_fee_base * GST_RATE
-    fee_mode = "Percentage" if str(fee_mode).lower().startswith("p") else "Fixed"
+    breakdowns = {}
+    for mode, components in gross.items():
+        net = apply_cashback_to_component_arrays({"interest": zeros, **components}, cashbacks[mode])
+        breakdowns[mode] = {"net": net, "net_total": sum(net.values())}
+    return breakdowns
 
-    if fee_mode == "Percentage":
-        principal_for_emi = purchase_amount + processing_fee_base + processing_fee_gst
-        upfront_processing_fee = 0.0
-        upfront_processing_gst = 0.0
-    else:
-        principal_for_emi = purchase_amount
-        upfront_processing_fee = processing_fee_base
-        upfront_processing_gst = processing_fee_gst
 
+# -------------------------------------------------
+# Schedule engines
+# -------------------------------------------------
+PAYWISE_ENGINES = ("numpy", "loop")
+
+SCHEDULE_COLUMNS = [
+    "Month",
+    "EMI",
+    "Principal Paid",
+    "Interest",
+    "GST on Interest (@18%)",
+    "Processing Fee",
+    "GST on Processing Fee (@18%)",
+    "Total Payment",
+    "Principal Remaining",
+]
+
+
+def _schedule_loop(principal_for_emi, interest_rate, tenure, upfront_fee, upfront_gst):
+    """
+    Reference engine: walk the schedule month by month.
+    """
     emi = calculate_emi(principal_for_emi, interest_rate, tenure)
     monthly_rate = interest_rate / 12 / 100
 
@@ -86,8 +296,8 @@ def compute_paywise(
         principal_paid = emi - interest
         balance -= principal_paid
 
-        processing_fee = upfront_processing_fee if month == 1 else 0
-        gst_processing_fee = upfront_processing_gst if month == 1 else 0
+        processing_fee = upfront_fee if month == 1 else 0
+        gst_processing_fee = upfront_gst if month == 1 else 0
 
         total_payment = (
             emi
@@ -108,17 +318,383 @@ def compute_paywise(
             "Principal Remaining": max(balance, 0),
         })
 
-    emi_df = pd.DataFrame(rows)
+    return pd.DataFrame(rows, columns=SCHEDULE_COLUMNS)
+
+
+def _schedule_numpy(principal_for_emi, interest_rate, tenure, upfront_fee, upfront_gst):
+    """
+    Closed-form engine: every column in one pass over preallocated arrays.
+    """
+    return AmortizationSchedule(
+        principal_for_emi, interest_rate, tenure, upfront_fee, upfront_gst
+    ).rows()
+
+
+# -------------------------------------------------
+# Lazy schedule
+# -------------------------------------------------
+class AmortizationSchedule:
+    """
+    Lazy, columnar stand-in for emi_df. Only EMI, rate, principal and the
+    month-1 fee terms are stored; columns, row slices and the full
+    DataFrame are built from the closed form on demand.
+    Balance after k months is P * ((1+r)^n - (1+r)^k) / ((1+r)^n - 1).
+    """
+
+    columns = pd.Index(SCHEDULE_COLUMNS)
+
+    def __init__(self, principal_for_emi, interest_rate, tenure, upfront_fee=0.0, upfront_gst=0.0):
+        self.principal = principal_for_emi
+        self.interest_rate = interest_rate
+        self.tenure = int(tenure)
+        self.upfront_fee = upfront_fee
+        self.upfront_gst = upfront_gst
+        self.monthly_rate = interest_rate / 12 / 100
+        self.emi = calculate_emi(principal_for_emi, interest_rate, self.tenure)
+        self._balances = None
+
+    def __len__(self):
+        return self.tenure
+
+    def __repr__(self):
+        return (
+            f"AmortizationSchedule(principal={self.principal!r}, "
+            f"interest_rate={self.interest_rate!r}, tenure={self.tenure})"
+        )
 
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return pd.Series(self.column(key), name=key)
+        return pd.DataFrame({name: self.column(name) for name in key})
+
+    @property
+    def iloc(self):
+        return _ScheduleRows(self)
+
+    @property
+    def empty(self):
+        return self.tenure == 0
+
+    def remaining(self, months):
+        """
+        Principal outstanding after `months` payments.
+        """
+        return balance_after(self.principal, self.interest_rate, self.tenure, months)
+
+    def balances(self) -> np.ndarray:
+        """
+        Balance after 0..tenure payments, computed once and shared by every
+        derived column.
+        """
+        if self._balances is None:
+            self._balances = self.remaining(np.arange(self.tenure + 1))
+            self._balances.flags.writeable = False
+        return self._balances
+
+    def column(self, name, start=0, stop=None) -> np.ndarray:
+        stop = self.tenure if stop is None else stop
+        months = np.arange(start + 1, stop + 1)
+        if name == "Month":
+            return months
+        if name == "EMI":
+            return np.full(len(months), self.emi)
+        if name == "Principal Remaining":
+            return np.maximum(self.balances()[start + 1:stop + 1], 0)
+        if name == "Processing Fee":
+            return np.where(months == 1, self.upfront_fee, 0.0)
+        if name == "GST on Processing Fee (@18%)":
+            return np.where(months == 1, self.upfront_gst, 0.0)
+
+        interest = self.balances()[start:stop] * self.monthly_rate
+        if name == "Interest":
+            return interest
+        if name == "Principal Paid":
+            return self.emi - interest
+        if name == "GST on Interest (@18%)":
+            return interest * GST_RATE
+        if name == "Total Payment":
+            fees = np.where(months == 1, self.upfront_fee + self.upfront_gst, 0.0)
+            return self.emi + interest * GST_RATE + fees
+        raise KeyError(name)
+
+    def rows(self, start=0, stop=None) -> pd.DataFrame:
+        stop = self.tenure if stop is None else stop
+        return pd.DataFrame(
+            {name: self.column(name, start, stop) for name in SCHEDULE_COLUMNS},
+            index=pd.RangeIndex(start, stop),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Full DataFrame, built fresh on every call: a schedule may be shared
+        (e.g. from a cache), so it never hands out a frame it keeps.
+        """
+        return self.rows()
+
+    def total_interest(self) -> float:
+        if self.monthly_rate == 0:
+            return 0.0
+        return self.emi * self.tenure - self.principal
+
+    def total_paid(self) -> float:
+        return (
+            self.emi * self.tenure
+            + self.total_interest() * GST_RATE
+            + self.upfront_fee
+            + self.upfront_gst
+        )
+
+
+class _ScheduleRows:
+    """
+    Positional row access (`schedule.iloc[k]`, `schedule.iloc[a:b]`).
+    """
+
+    def __init__(self, schedule):
+        self._schedule = schedule
+
+    def __getitem__(self, key):
+        n = len(self._schedule)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(n)
+            if step == 1:
+                return self._schedule.rows(start, max(start, stop))
+            return self._schedule.to_frame().iloc[key]
+
+        position = key + n if key < 0 else key
+        if not 0 <= position < n:
+            raise IndexError("schedule row out of range")
+        return self._schedule.rows(position, position + 1).iloc[0]
+
+
+def schedule_frame(emi_df) -> pd.DataFrame:
+    """
+    Full DataFrame for either an eager emi_df or an AmortizationSchedule.
+    """
+    if isinstance(emi_df, AmortizationSchedule):
+        return emi_df.to_frame()
+    return emi_df
+
+
+# -------------------------------------------------
+# Unified calculation engine
+# -------------------------------------------------
+def compute_paywise(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    cashback_full: float,
+    cashback_emi: float,
+    cashback_nocost: float,
+    engine: str = "numpy",
+) -> dict:
+    """
+    Build the EMI schedule, totals, comparison rows and breakdowns.
+    `engine` selects the schedule builder: "numpy" (closed form) or
+    "loop" (month-by-month reference).
+    """
+    schedule = compute_paywise_schedule(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+        engine=engine,
+    )
+    return apply_paywise_cashback(schedule, cashback_full, cashback_emi, cashback_nocost)
+
+
+def compute_paywise_schedule(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    engine: str = "numpy",
+    lazy: bool = False,
+) -> dict:
+    """
+    Schedule stage of compute_paywise: emi_df plus the gross aggregates.
+    Depends only on amount, rate, tenure and fee, so it can be cached
+    across cashback edits. With `lazy=True` emi_df is an
+    AmortizationSchedule and nothing is materialized up front.
+    """
+    (
+        processing_fee_base,
+        processing_fee_gst,
+        principal_for_emi,
+        upfront_processing_fee,
+        upfront_processing_gst,
+    ) = _fee_terms(purchase_amount, processing_fee_base, fee_mode)
+
+    if engine not in PAYWISE_ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {PAYWISE_ENGINES}")
+
+    if lazy:
+        schedule = AmortizationSchedule(
+            principal_for_emi,
+            interest_rate,
+            tenure,
+            upfront_processing_fee,
+            upfront_processing_gst,
+        )
+        total_interest = schedule.total_interest()
+        return {
+            "emi_df": schedule,
+            "purchase_amount": purchase_amount,
+            "tenure": tenure,
+            "processing_fee_base": processing_fee_base,
+            "processing_fee_gst": processing_fee_gst,
+            "total_interest": total_interest,
+            "total_gst_interest": total_interest * GST_RATE,
+            "total_paid": schedule.total_paid(),
+        }
+
+    build_schedule = _schedule_numpy if engine == "numpy" else _schedule_loop
+    emi_df = build_schedule(
+        principal_for_emi,
+        interest_rate,
+        tenure,
+        upfront_processing_fee,
+        upfront_processing_gst,
+    )
+
+    return {
+        "emi_df": emi_df,
+        "purchase_amount": purchase_amount,
+        "tenure": tenure,
+        "processing_fee_base": processing_fee_base,
+        "processing_fee_gst": processing_fee_gst,
+        "total_interest": emi_df["Interest"].sum(),
+        "total_gst_interest": emi_df["GST on Interest (@18%)"].sum(),
+        "total_paid": emi_df["Total Payment"].sum(),
+    }
+
+
+def apply_paywise_cashback(
+    schedule: dict,
+    cashback_full: float,
+    cashback_emi: float,
+    cashback_nocost: float,
+) -> dict:
+    """
+    Cashback stage of compute_paywise: constant-time totals, comparison
+    and breakdowns on top of a compute_paywise_schedule result.
+    """
+    summary = _summarize_paywise(
+        schedule["purchase_amount"],
+        schedule["tenure"],
+        schedule["processing_fee_base"],
+        schedule["processing_fee_gst"],
+        total_interest=schedule["total_interest"],
+        total_gst_interest=schedule["total_gst_interest"],
+        total_paid=schedule["total_paid"],
+        cashback_full=cashback_full,
+        cashback_emi=cashback_emi,
+        cashback_nocost=cashback_nocost,
+    )
+    return {"emi_df": schedule["emi_df"], **summary}
+
+
+def compute_paywise_totals(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    cashback_full: float,
+    cashback_emi: float,
+    cashback_nocost: float,
+) -> dict:
+    """
+    Totals-only fast path: same totals, averages, comparison and
+    breakdowns as compute_paywise, from the annuity identities in O(1)
+    and without building emi_df.
+    """
+    (
+        processing_fee_base,
+        processing_fee_gst,
+        principal_for_emi,
+        upfront_processing_fee,
+        upfront_processing_gst,
+    ) = _fee_terms(purchase_amount, processing_fee_base, fee_mode)
+
+    schedule = AmortizationSchedule(
+        principal_for_emi,
+        interest_rate,
+        tenure,
+        upfront_processing_fee,
+        upfront_processing_gst,
+    )
+    total_interest = schedule.total_interest()
+
+    return _summarize_paywise(
+        purchase_amount,
+        tenure,
+        processing_fee_base,
+        processing_fee_gst,
+        total_interest=total_interest,
+        total_gst_interest=total_interest * GST_RATE,
+        total_paid=schedule.total_paid(),
+        cashback_full=cashback_full,
+        cashback_emi=cashback_emi,
+        cashback_nocost=cashback_nocost,
+    )
+
+
+def fee_terms(purchase_amount, processing_fee_base, financed):
+    """
+    Percentage fees (+GST) are financed into the EMI principal;
+    fixed fees (+GST) are charged upfront in month 1. `financed` is a bool
+    or boolean array and every argument may be a scalar or an array.
+    Returns (fee, fee GST, principal for EMI, upfront fee, upfront GST).
+    """
+    if isinstance(processing_fee_base, np.ndarray):
+        processing_fee_base = np.maximum(processing_fee_base, 0.0)
+    else:
+        processing_fee_base = max(float(processing_fee_base), 0.0)
+    processing_fee_gst = processing_fee_base * GST_RATE
+    # 1.0 where the fee is financed, 0.0 where it is paid upfront
+    share = financed * 1.0
+
+    principal_for_emi = purchase_amount + share * (processing_fee_base + processing_fee_gst)
+    upfront_processing_fee = (1.0 - share) * processing_fee_base
+    upfront_processing_gst = (1.0 - share) * processing_fee_gst
+
+    return (
+        processing_fee_base,
+        processing_fee_gst,
+        principal_for_emi,
+        upfront_processing_fee,
+        upfront_processing_gst,
+    )
+
+
+def _fee_terms(purchase_amount, processing_fee_base, fee_mode):
+    """fee_terms for a single offer with a "Percentage"/"Fixed" fee mode."""
+    financed = str(fee_mode).lower().startswith("p")
+    return fee_terms(purchase_amount, processing_fee_base, financed)
+
+
+def _summarize_paywise(
+    purchase_amount,
+    tenure,
+    processing_fee_base,
+    processing_fee_gst,
+    total_interest,
+    total_gst_interest,
+    total_paid,
+    cashback_full,
+    cashback_emi,
+    cashback_nocost,
+) -> dict:
     # -------------------------------------------------
     # Aggregates (NO CHANGE in meaning)
     # -------------------------------------------------
-    total_interest = emi_df["Interest"].sum()
-    total_gst_interest = emi_df["GST on Interest (@18%)"].sum()
     total_processing_fee = processing_fee_base
     total_gst_fee = processing_fee_gst
-
-    total_paid = emi_df["Total Payment"].sum()
     total_fee_with_gst = total_processing_fee + total_gst_fee
 
     totals = {
@@ -221,7 +797,6 @@ def compute_paywise(
     }
 
     return {
-        "emi_df": emi_df,
         "totals": totals,
         "averages": averages,
         "comparison": comparison,
@@ -230,16 +805,70 @@ def compute_paywise(
 
 
 # -------------------------------------------------
-# Yearly view (UNCHANGED)
+# Yearly view
 # -------------------------------------------------
-def yearly_view(df):
-    return (
-        df.groupby((df.index // 12) + 1)
-        .sum()
-        .reset_index(drop=True)
-    )
+# Flows are summed per year; anything not listed here is a flow.
+YEARLY_REDUCTIONS = {
+    "Month": "last",
+    "EMI": "first",
+    "Principal Remaining": "last",
+}
 
 
+def yearly_view(df):
+    """
+    One row per 12-month block (the final year may be partial): flows are
+    summed, balances take the year-end value, "Month" is the last month
+    covered and "Year" counts from 1.
+    """
+    df = schedule_frame(df)
+    months = len(df)
+    starts = np.arange(0, months, 12)
+    ends = np.minimum(starts + 12, months) - 1
+
+    yearly = {"Year": np.arange(1, len(starts) + 1)}
+    for name in df.columns:
+        values = df[name].to_numpy()
+        how = YEARLY_REDUCTIONS.get(name, "sum")
+        if how == "first":
+            yearly[name] = values[starts]
+        elif how == "last":
+            yearly[name] = values[ends]
+        else:
+            yearly[name] = np.add.reduceat(values, starts) if months else values[:0]
+    return pd.DataFrame(yearly)
+
+
+def yearly_aggregate(columns: dict, tenure=None) -> dict:
+    """
+    yearly_view for many schedules at once. `columns` maps names to 2-D
+    arrays (schedules x months, zero-padded past each tenure) and the
+    result maps the same names to (schedules x years) arrays via a padded
+    reshape. Years past a schedule's tenure are zero.
+    """
+    first = next(iter(columns.values()))
+    count, months = first.shape
+    tenure = np.full(count, months) if tenure is None else np.asarray(tenure)
+    years = -(-months // 12)
+    pad = years * 12 - months
+
+    year_starts = np.arange(years) * 12
+    year_ends = np.minimum(year_starts[None, :] + 11, tenure[:, None] - 1)
+    in_tenure = year_starts[None, :] < tenure[:, None]
+
+    yearly = {}
+    for name, values in columns.items():
+        how = YEARLY_REDUCTIONS.get(name, "sum")
+        if how == "sum":
+            padded = np.pad(values, ((0, 0), (0, pad)))
+            reduced = padded.reshape(count, years, 12).sum(axis=2)
+        elif how == "first":
+            reduced = values[:, year_starts]
+        else:
+            reduced = np.take_along_axis(values, np.maximum(year_ends, 0), axis=1)
+        yearly[name] = np.where(in_tenure, reduced, 0)
+    return yearly
+
 
 # -------------------------------------------------
 # Backward compatibility wrapper
@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    GST_RATE,
+    SCHEDULE_COLUMNS,
+    annuity_balance,
+    annuity_payment,
+    annuity_payoff,
+    annuity_segment,
+    annuity_term,
+)
+
+RESET_MODES = ("reset_emi", "reset_tenure")
+
+
+def _check_resets(reset_months, mode):
+    if mode not in RESET_MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {RESET_MODES}")
+    reset_months = np.asarray(reset_months, dtype=float)
+    if reset_months.size and (np.any(np.diff(reset_months) <= 0) or reset_months[0] < 1):
+        raise ValueError("Reset months must be increasing and start at month 1 or later")
+    return reset_months
+
+
+def _next_emi(balance, monthly_rate, emi, months_left, reset, mode):
+    """
+    EMI after a rate reset. "reset_emi" re-amortizes over the months left
+    on the original tenure; "reset_tenure" keeps the EMI unless it no
+    longer covers the interest, in which case it falls back to reset_emi.
+    """
+    reamortized = annuity_payment(balance, monthly_rate, np.maximum(months_left, 1))
+    if mode == "reset_emi":
+        return np.where(reset, reamortized, emi)
+    short = balance * monthly_rate >= emi
+    return np.where(reset & short, reamortized, emi)
+
+
+def rate_path_totals(
+    principal,
+    tenure,
+    initial_rate,
+    reset_months,
+    reset_rates,
+    mode="reset_emi",
+    upfront_fee=0.0,
+    upfront_gst=0.0,
+) -> dict:
+    """
+    Totals for a floating-rate loan under one or many rate paths.
+
+    `reset_months` (increasing) are the months from which each new annual
+    rate applies; `reset_rates` is (paths x resets) or a single path.
+    Work is one closed-form annuity segment per reset, vectorized across
+    paths, so cost is proportional to resets rather than months.
+    `upfront_fee` and `upfront_gst` are the month-1 processing fee and its
+    GST, as in floating_rate_schedule.
+    """
+    reset_months = _check_resets(reset_months, mode)
+    reset_rates = np.atleast_2d(np.asarray(reset_rates, dtype=float))
+    paths = reset_rates.shape[0]
+
+    r = np.full(paths, initial_rate / 12 / 100)
+    balance = np.full(paths, float(principal))
+    emi = annuity_payment(balance, r, tenure)
+    elapsed = np.zeros(paths)
+    paid = np.zeros(paths)
+
+    for col, month in enumerate(reset_months):
+        start = month - 1
+        resets = (start < elapsed + annuity_term(balance, r, emi) - 1e-9) & (balance > 0)
+        step = np.where(resets, start - elapsed, 0)
+
+        paid += step * emi
+        balance = np.where(resets, annuity_balance(balance, r, emi, step), balance)
+        elapsed = np.where(resets, start, elapsed)
+        r = np.where(resets, reset_rates[:, col] / 12 / 100, r)
+        emi = _next_emi(balance, r, emi, tenure - elapsed, resets, mode)
+
+    payments, closing_paid = annuity_payoff(balance, r, emi)
+    paid += closing_paid
+    total_interest = paid - principal
+
+    return {
+        "months": elapsed + payments,
+        "final_emi": emi,
+        "final_rate": r * 12 * 100,
+        "total_interest": total_interest,
+        "total_gst_interest": total_interest * GST_RATE,
+        "total_paid": paid + total_interest * GST_RATE + upfront_fee + upfront_gst,
+    }
+
+
+def floating_rate_schedule(
+    principal,
+    tenure,
+    initial_rate,
+    resets,
+    mode="reset_emi",
+    upfront_fee=0.0,
+    upfront_gst=0.0,
+) -> pd.DataFrame:
+    """
+    emi_df-shaped schedule for one rate path given as (month, annual rate)
+    resets, built segment by segment from the closed form. `upfront_fee`
+    (excluding GST) and `upfront_gst` are charged in month 1.
+    """
+    resets = sorted(resets)
+    reset_months = _check_resets([month for month, _ in resets], mode)
+
+    r = initial_rate / 12 / 100
+    balance = float(principal)
+    emi = float(annuity_payment(balance, r, tenure))
+    elapsed = 0
+    segments = []
+
+    boundaries = [(m - 1, rate) for m, (_, rate) in zip(reset_months, resets)]
+    for start, rate in boundaries + [(np.inf, None)]:
+        last_month = elapsed + int(np.ceil(annuity_term(balance, r, emi) - 1e-9))
+        stop = int(min(start, last_month))
+        if stop > elapsed:
+            segments.append((elapsed, stop, balance, r, emi))
+            balance = float(annuity_balance(balance, r, emi, stop - elapsed))
+            elapsed = stop
+        if start >= last_month:
+            break
+
+        r = rate / 12 / 100
+        emi = float(_next_emi(balance, r, emi, tenure - elapsed, True, mode))
+
+    frames = []
+    for start, stop, opening, monthly_rate, seg_emi in segments:
+        rows = annuity_segment(opening, monthly_rate, seg_emi, stop - start)
+        frames.append(pd.DataFrame({
+            "Month": np.arange(start + 1, stop + 1),
+            "EMI": rows["principal_paid"] + rows["interest"],
+            "Principal Paid": rows["principal_paid"],
+            "Interest": rows["interest"],
+            "GST on Interest (@18%)": rows["interest"] * GST_RATE,
+            "Principal Remaining": np.maximum(rows["opening"] - rows["principal_paid"], 0),
+        }))
+
+    emi_df = pd.concat(frames, ignore_index=True)
+    emi_df["Processing Fee"] = 0.0
+    emi_df["GST on Processing Fee (@18%)"] = 0.0
+    emi_df.loc[0, "Processing Fee"] = upfront_fee
+    emi_df.loc[0, "GST on Processing Fee (@18%)"] = upfront_gst
+    emi_df["Total Payment"] = (
+        emi_df["EMI"]
+        + emi_df["GST on Interest (@18%)"]
+        + emi_df["Processing Fee"]
+        + emi_df["GST on Processing Fee (@18%)"]
+    )
+    return emi_df[SCHEDULE_COLUMNS]
@@ -13,6 +13,8 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 
+from utils.investment import sip_milestones, sip_values_at
+
 
 def generate_invest_pdf_bytes(
     monthly_df,
@@ -29,7 +31,14 @@ def generate_invest_pdf_bytes(
     styles = getSampleStyleSheet()
     elements = []
 
-    last = monthly_df.iloc[-1]
+    last = sip_values_at(
+        monthly_sip,
+        stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        [years * 12],
+        start_year,
+    ).iloc[0]
 
     elements.append(Paragraph("<b>Step-Up SIP Investment Report</b>", styles["Title"]))
     elements.append(Spacer(1, 10))
@@ -76,12 +85,19 @@ def generate_invest_pdf_bytes(
     elements.append(Paragraph("<b>5-Year Growth Milestones</b>", styles["Heading2"]))
     elements.append(Spacer(1, 6))
 
-    milestones = yearly_df[yearly_df["Year"].sub(start_year).mod(5) == 4]
+    milestones = sip_milestones(
+        monthly_sip,
+        stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        years,
+        start_year,
+    )
     milestone_data = [["Years Completed", "Total Invested", "Nominal", "Real"]]
 
     for _, r in milestones.iterrows():
         milestone_data.append([
-            r["Year"] - start_year + 1,
+            r["Years Completed"],
             f"{r['Total Invested']:,.0f}",
             f"{r['Nominal Amount']:,.0f}",
             f"{r['Inflation Adjusted Amount']:,.0f}",
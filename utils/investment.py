@@ -1,5 +1,16 @@
+import numpy as np
 import pandas as pd
 
+SIP_ENGINES = ("numpy", "loop")
+
+SIP_COLUMNS = [
+    "Year",
+    "Month Index",
+    "Total Invested",
+    "Nominal Amount",
+    "Inflation Adjusted Amount",
+]
+
 
 def calculate_stepup_sip_inflation_adjusted(
     monthly_sip,
@@ -8,7 +19,36 @@ def calculate_stepup_sip_inflation_adjusted(
     annual_inflation_percent,
     years,
     start_year,
+    engine="numpy",
+):
+    """
+    Month-by-month step-up SIP values. `engine` is "numpy" (cumulative
+    sums and products) or "loop" (the month-by-month reference).
+    """
+    if engine not in SIP_ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {SIP_ENGINES}")
+    build = _sip_numpy if engine == "numpy" else _sip_loop
+    return build(
+        monthly_sip,
+        annual_stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        years,
+        start_year,
+    )
+
+
+def _sip_loop(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    start_year,
 ):
+    """
+    Reference engine: walk the SIP month by month.
+    """
     monthly_return = (annual_return_percent / 100) / 12
     monthly_inflation = (annual_inflation_percent / 100) / 12
     total_months = years * 12
@@ -44,6 +84,248 @@ def calculate_stepup_sip_inflation_adjusted(
     return pd.DataFrame(rows)
 
 
+def _sip_numpy(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    start_year,
+):
+    """
+    Vectorized engine. Each month the SIP s is added, then
+        N <- (N + s) * (1 + rho)
+        R <- (R + s) * (1 - i) + rho * (N_prev + s)
+    Both are first-order linear recurrences, solved with cumulative
+    products of the growth factor and cumulative sums of the discounted
+    contributions. Year comes from integer month arithmetic.
+    """
+    monthly_return = (annual_return_percent / 100) / 12
+    monthly_inflation = (annual_inflation_percent / 100) / 12
+    total_months = int(years * 12)
+
+    months = np.arange(1, total_months + 1)
+    year_index = (months - 1) // 12
+    sip = monthly_sip * (1 + annual_stepup_percent / 100) ** year_index
+
+    invested = np.cumsum(sip)
+
+    # N_m = (1+rho)^m * sum_j s_j / (1+rho)^(j-1)
+    growth = np.cumprod(np.full(total_months, 1 + monthly_return))
+    nominal = growth * np.cumsum(sip / (growth / (1 + monthly_return)))
+
+    # R_m = q^m * sum_j u_j / q^j with q = 1 - i, u_j = q*s_j + rho*N_j/(1+rho)
+    keep = 1 - monthly_inflation
+    contribution = keep * sip + monthly_return * nominal / (1 + monthly_return)
+    if keep == 0:
+        real = contribution
+    else:
+        decay = np.cumprod(np.full(total_months, keep))
+        real = decay * np.cumsum(contribution / decay)
+
+    return pd.DataFrame({
+        "Year": start_year + year_index,
+        "Month Index": months,
+        "Total Invested": invested,
+        "Nominal Amount": nominal,
+        "Inflation Adjusted Amount": real,
+    })[SIP_COLUMNS]
+
+
+# -------------------------------------------------
+# Closed-form values at chosen months
+# -------------------------------------------------
+def _geometric_sum(ratio, count):
+    """1 + c + ... + c^(n-1), written to stay exact for c near 1."""
+    log_ratio = np.log(ratio)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(log_ratio == 0, count, np.expm1(count * log_ratio) / np.expm1(log_ratio))
+
+
+def _compounded_sip(monthly_sip, stepup_factor, factor, months):
+    """
+    sum over contributions j <= m of s_j * factor^(m - j + 1), where the
+    SIP steps up by `stepup_factor` every 12 months. factor=1 gives the
+    amount invested.
+    """
+    full_years, partial = np.divmod(months, 12)
+    per_year = _geometric_sum(factor, 12)
+    past_years = (
+        per_year
+        * factor ** (months - 11.0)
+        * _geometric_sum(stepup_factor / factor**12, full_years)
+    )
+    this_year = stepup_factor**full_years * factor * _geometric_sum(factor, partial)
+    return monthly_sip * (past_years + this_year)
+
+
+def _compounded_sip_slope(monthly_sip, stepup_factor, factor, months):
+    """
+    d/d(factor) of _compounded_sip: sum of s_j * (m - j + 1) * factor^(m - j).
+    Taken as a complex-step derivative, which has no subtraction and so
+    stays exact to rounding.
+    """
+    step = 1e-20
+    return np.imag(_compounded_sip(monthly_sip, stepup_factor, factor + step * 1j, months)) / step
+
+
+def sip_final_values(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    months,
+) -> dict:
+    """
+    Invested, nominal and real values after `months` months from
+    geometric series, broadcasting over every argument (arrays of plans
+    in, arrays of values out).
+
+    With rho the monthly return and i the monthly inflation, the real
+    value is R = (i * Q + rho * N) / (rho + i), where N is the nominal
+    value and Q the same SIP compounded at 1 - i. Equivalently
+    R = Q + rho * (N - Q) / (rho + i); where rho + i is ~0 the quotient is
+    replaced by its limit, the slope of N in the growth factor (taken at
+    the midpoint of 1 + rho and 1 - i).
+    """
+    monthly_sip, stepup, returns, inflation, months = np.broadcast_arrays(
+        np.asarray(monthly_sip, dtype=float),
+        np.asarray(annual_stepup_percent, dtype=float),
+        np.asarray(annual_return_percent, dtype=float),
+        np.asarray(annual_inflation_percent, dtype=float),
+        np.asarray(months, dtype=int),
+    )
+    monthly_return = returns / 100 / 12
+    monthly_inflation = inflation / 100 / 12
+    stepup_factor = 1 + stepup / 100
+
+    invested = _compounded_sip(monthly_sip, stepup_factor, 1.0, months)
+    nominal = _compounded_sip(monthly_sip, stepup_factor, 1 + monthly_return, months)
+    deflated = _compounded_sip(monthly_sip, stepup_factor, 1 - monthly_inflation, months)
+
+    gap = monthly_return + monthly_inflation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        real = np.asarray((monthly_inflation * deflated + monthly_return * nominal) / gap)
+
+    limit = np.abs(gap) < 1e-7
+    if limit.any():
+        midpoint = 1 + (monthly_return[limit] - monthly_inflation[limit]) / 2
+        slope = _compounded_sip_slope(
+            monthly_sip[limit], stepup_factor[limit], midpoint, months[limit]
+        )
+        real[limit] = deflated[limit] + monthly_return[limit] * slope
+
+    return {"invested": invested, "nominal": nominal, "real": real}
+
+
+def sip_values_at(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    months,
+    start_year,
+):
+    """
+    Rows of calculate_stepup_sip_inflation_adjusted at the given month
+    indices in O(len(months)) (see sip_final_values).
+    """
+    months = np.atleast_1d(np.asarray(months, dtype=int))
+    values = sip_final_values(
+        monthly_sip,
+        annual_stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        months,
+    )
+    return pd.DataFrame({
+        "Year": start_year + (months - 1) // 12,
+        "Month Index": months,
+        "Total Invested": values["invested"],
+        "Nominal Amount": values["nominal"],
+        "Inflation Adjusted Amount": values["real"],
+    })[SIP_COLUMNS]
+
+
+def sip_milestones(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    start_year,
+    every=5,
+):
+    """
+    Values at the end of every `every`-th year, with a "Years Completed"
+    column.
+    """
+    completed = np.arange(every, int(years) + 1, every)
+    milestones = sip_values_at(
+        monthly_sip,
+        annual_stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        completed * 12,
+        start_year,
+    )
+    milestones.insert(0, "Years Completed", completed)
+    return milestones
+
+
+SIP_GRID_AXES = {
+    "annual_return_percent": "Expected Return (%)",
+    "annual_stepup_percent": "Annual Step-Up (%)",
+    "annual_inflation_percent": "Inflation (%)",
+}
+
+
+def sip_value_grid(
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    row_axis,
+    row_values,
+    col_axis,
+    col_values,
+) -> dict:
+    """
+    Final nominal and real values over a row_axis x col_axis grid of
+    parameters (keys of SIP_GRID_AXES), the other inputs held fixed.
+    One broadcast sip_final_values call; returns {"nominal", "real"}
+    DataFrames indexed by row values with one column per col value.
+    """
+    for axis in (row_axis, col_axis):
+        if axis not in SIP_GRID_AXES:
+            raise ValueError(f"Unknown axis {axis!r}; expected one of {list(SIP_GRID_AXES)}")
+    if row_axis == col_axis:
+        raise ValueError("row_axis and col_axis must differ")
+
+    row_values = np.asarray(row_values, dtype=float)
+    col_values = np.asarray(col_values, dtype=float)
+    params = {
+        "annual_stepup_percent": annual_stepup_percent,
+        "annual_return_percent": annual_return_percent,
+        "annual_inflation_percent": annual_inflation_percent,
+        row_axis: row_values[:, None],
+        col_axis: col_values[None, :],
+    }
+    finals = sip_final_values(monthly_sip, months=np.asarray(years) * 12, **params)
+
+    index = pd.Index(row_values, name=SIP_GRID_AXES[row_axis])
+    columns = pd.Index(col_values, name=SIP_GRID_AXES[col_axis])
+    return {
+        value: pd.DataFrame(
+            np.broadcast_to(finals[value], (len(row_values), len(col_values))),
+            index=index,
+            columns=columns,
+        )
+        for value in ("nominal", "real")
+    }
+
+
 def convert_monthly_to_yearly(df):
     return (
         df.groupby("Year")
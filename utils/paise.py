@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    GST_RATE,
+    SCHEDULE_COLUMNS,
+    annuity_payment,
+    apply_paywise_cashback,
+)
+
+ROUNDING_RULES = ("half_up", "half_even", "floor")
+# line items that can each carry their own rule
+ROUNDING_COMPONENTS = ("emi", "interest", "gst", "fee")
+
+GST_PERCENT = round(GST_RATE * 100)
+# Annual rates are carried in 1/10,000ths of a percent, so a monthly rate is
+# rate_units / RATE_DENOMINATOR with RATE_DENOMINATOR = 12 months * 100% * 10,000.
+RATE_SCALE = 10_000
+RATE_DENOMINATOR = 12 * 100 * RATE_SCALE
+
+
+# -------------------------------------------------
+# Integer rounding
+# -------------------------------------------------
+def _check_rule(rounding):
+    if rounding not in ROUNDING_RULES:
+        raise ValueError(f"Unknown rounding {rounding!r}; expected one of {ROUNDING_RULES}")
+
+
+def rounding_rules(rounding="half_up") -> dict:
+    """
+    Rule per component of ROUNDING_COMPONENTS, from one rule name for
+    all of them or a mapping such as {"interest": "floor", "gst": "half_up"}.
+    Components left out of a mapping round "half_up".
+    """
+    if isinstance(rounding, str):
+        _check_rule(rounding)
+        return dict.fromkeys(ROUNDING_COMPONENTS, rounding)
+
+    unknown = set(rounding) - set(ROUNDING_COMPONENTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown rounding components {sorted(unknown)}; expected {ROUNDING_COMPONENTS}"
+        )
+    rules = dict.fromkeys(ROUNDING_COMPONENTS, "half_up")
+    rules.update(rounding)
+    for rule in rules.values():
+        _check_rule(rule)
+    return rules
+
+
+def divide_rounded(numerator, denominator, rounding="half_up"):
+    """
+    Exact integer numerator / denominator (denominator > 0) under a bank
+    rounding rule: "half_up" (ties away from zero), "half_even" (banker's)
+    or "floor".
+    """
+    _check_rule(rounding)
+    numerator = np.asarray(numerator, dtype=np.int64)
+    quotient, remainder = np.divmod(numerator, denominator)
+    if rounding == "floor":
+        return quotient
+
+    twice = 2 * remainder
+    if rounding == "half_up":
+        # divmod floors, so a tie on a negative numerator stays on the floor side
+        round_up = (twice > denominator) | ((twice == denominator) & (numerator >= 0))
+    else:
+        round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
+
+
+def to_paise(amount, rounding="half_up"):
+    """
+    Rupee amounts to int64 paise. Inputs are first snapped to 1e-6 paise so
+    float noise (1.005 * 100 = 100.49999...) doesn't decide the rounding.
+    """
+    _check_rule(rounding)
+    scaled = np.round(np.asarray(amount, dtype=float) * 100, 6)
+    if rounding == "floor":
+        rounded = np.floor(scaled)
+    elif rounding == "half_even":
+        rounded = np.rint(scaled)
+    else:
+        rounded = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    return rounded.astype(np.int64)
+
+
+# -------------------------------------------------
+# Vectorized paise schedule (offers x months)
+# -------------------------------------------------
+def paise_schedule_arrays(
+    principal_paise,
+    interest_rate,
+    tenure,
+    upfront_fee_paise=0,
+    upfront_gst_paise=0,
+    rounding="half_up",
+) -> dict:
+    """
+    Lender-style schedule in int64 paise for many offers at once.
+    The EMI is rounded to the paisa once and charged unchanged every month
+    except the last, which clears whatever balance is left; interest and
+    GST are rounded every month. `rounding` is a rule or a per-component
+    mapping (see rounding_rules). Returns 2-D arrays (offers x longest
+    tenure), zero beyond each offer's tenure.
+    """
+    rules = rounding_rules(rounding)
+    principal = np.atleast_1d(np.asarray(principal_paise, dtype=np.int64))
+    rate_units = np.atleast_1d(np.rint(np.asarray(interest_rate, dtype=float) * RATE_SCALE))
+    tenure = np.atleast_1d(np.asarray(tenure, dtype=np.int64))
+    principal, rate_units, tenure, fee, fee_gst = np.broadcast_arrays(
+        principal,
+        rate_units.astype(np.int64),
+        tenure,
+        np.asarray(upfront_fee_paise, dtype=np.int64),
+        np.asarray(upfront_gst_paise, dtype=np.int64),
+    )
+
+    emi_rupees = annuity_payment(principal / 100, rate_units / RATE_DENOMINATOR, tenure)
+    emi = to_paise(emi_rupees, rules["emi"])
+
+    months = int(tenure.max())
+    shape = (len(principal), months)
+    columns = {
+        name: np.zeros(shape, dtype=np.int64)
+        for name in ("EMI", "Principal Paid", "Interest", "GST on Interest (@18%)")
+    }
+    remaining = np.zeros(shape, dtype=np.int64)
+
+    balance = principal.copy()
+    for m in range(months):
+        active = m < tenure
+        last = m == tenure - 1
+
+        interest = divide_rounded(balance * rate_units, RATE_DENOMINATOR, rules["interest"])
+        principal_paid = np.where(last, balance, emi - interest)
+        principal_paid = np.where(active, principal_paid, 0)
+        interest = np.where(active, interest, 0)
+
+        balance = balance - principal_paid
+        columns["EMI"][:, m] = principal_paid + interest
+        columns["Principal Paid"][:, m] = principal_paid
+        columns["Interest"][:, m] = interest
+        columns["GST on Interest (@18%)"][:, m] = divide_rounded(
+            interest * GST_PERCENT, 100, rules["gst"]
+        )
+        remaining[:, m] = np.where(active, balance, 0)
+
+    processing_fee = np.zeros(shape, dtype=np.int64)
+    gst_processing_fee = np.zeros(shape, dtype=np.int64)
+    processing_fee[:, 0] = fee
+    gst_processing_fee[:, 0] = fee_gst
+
+    columns["Processing Fee"] = processing_fee
+    columns["GST on Processing Fee (@18%)"] = gst_processing_fee
+    columns["Total Payment"] = (
+        columns["EMI"]
+        + columns["GST on Interest (@18%)"]
+        + processing_fee
+        + gst_processing_fee
+    )
+    columns["Principal Remaining"] = remaining
+    return columns
+
+
+# -------------------------------------------------
+# Exact compute_paywise
+# -------------------------------------------------
+def compute_paywise_paise(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    cashback_full: float,
+    cashback_emi: float,
+    cashback_nocost: float,
+    rounding: str | dict = "half_up",
+) -> dict:
+    """
+    compute_paywise with money carried as int64 paise and rounded per
+    monthly line item, under one rule or a per-component mapping (see
+    rounding_rules). The purchase amount is converted half-up. emi_df and
+    totals are in rupees (exact paise / 100); "totals_paise" holds the
+    exact integer sums for reconciliation.
+    """
+    rules = rounding_rules(rounding)
+    purchase_paise = int(to_paise(purchase_amount))
+    fee_paise = int(to_paise(max(float(processing_fee_base), 0.0), rules["fee"]))
+    fee_gst_paise = int(divide_rounded(fee_paise * GST_PERCENT, 100, rules["gst"]))
+    financed = str(fee_mode).lower().startswith("p")
+
+    if financed:
+        principal_paise = purchase_paise + fee_paise + fee_gst_paise
+        upfront_fee, upfront_gst = 0, 0
+    else:
+        principal_paise = purchase_paise
+        upfront_fee, upfront_gst = fee_paise, fee_gst_paise
+
+    columns = paise_schedule_arrays(
+        principal_paise, interest_rate, tenure, upfront_fee, upfront_gst, rules
+    )
+    paise_df = pd.DataFrame({name: columns[name][0] for name in columns})
+    paise_df.insert(0, "Month", np.arange(1, int(tenure) + 1))
+    paise_df = paise_df[SCHEDULE_COLUMNS]
+
+    totals_paise = {
+        "total_interest": int(paise_df["Interest"].sum()),
+        "total_gst_interest": int(paise_df["GST on Interest (@18%)"].sum()),
+        "total_processing_fee": fee_paise,
+        "total_gst_processing_fee": fee_gst_paise,
+        "total_paid": int(paise_df["Total Payment"].sum()),
+    }
+
+    emi_df = paise_df.astype(float)
+    emi_df["Month"] = paise_df["Month"]
+    money_columns = [name for name in SCHEDULE_COLUMNS if name != "Month"]
+    emi_df[money_columns] = emi_df[money_columns] / 100
+
+    schedule = {
+        "emi_df": emi_df,
+        "purchase_amount": purchase_paise / 100,
+        "tenure": tenure,
+        "processing_fee_base": fee_paise / 100,
+        "processing_fee_gst": fee_gst_paise / 100,
+        "total_interest": totals_paise["total_interest"] / 100,
+        "total_gst_interest": totals_paise["total_gst_interest"] / 100,
+        "total_paid": totals_paise["total_paid"] / 100,
+    }
+    data = apply_paywise_cashback(schedule, cashback_full, cashback_emi, cashback_nocost)
+    data["totals_paise"] = totals_paise
+    return data
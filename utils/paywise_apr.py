@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import GST_RATE, annuity_balance, annuity_payment, fee_terms
+from utils.paywise_batch import offer_arrays
+
+APR_MODES = ("emi", "nocost")
+
+
+def offer_cash_flows(arrays: dict, mode="emi") -> np.ndarray:
+    """
+    Monthly outflows (offers x max tenure) for offer_arrays() output, zero
+    past each offer's tenure. Month 1 carries the upfront fee (with GST)
+    and is reduced by the mode's cashback.
+
+    "emi": EMI + GST on that month's interest, i.e. emi_df "Total Payment".
+    "nocost": purchase / tenure + GST on the underlying loan's interest,
+    with the fee always paid in month 1.
+    The flows of each offer add up to its effective cost.
+    """
+    if mode not in APR_MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {APR_MODES}")
+
+    purchase = arrays["purchase_amount"]
+    tenure = arrays["tenure"].astype(int)
+    fee, fee_gst, principal, upfront_fee, upfront_gst = fee_terms(
+        purchase, arrays["processing_fee_base"], arrays["financed"]
+    )
+    monthly_rate = arrays["interest_rate"] / 12 / 100
+    emi = annuity_payment(principal, monthly_rate, tenure)
+
+    steps = np.arange(tenure.max(initial=0))
+    live = steps[None, :] < tenure[:, None]
+    opening = annuity_balance(
+        principal[:, None], monthly_rate[:, None], emi[:, None], steps[None, :]
+    )
+    gst_interest = opening * monthly_rate[:, None] * GST_RATE
+
+    if mode == "emi":
+        instalment = emi
+        upfront = upfront_fee + upfront_gst
+    else:
+        instalment = purchase / tenure
+        upfront = fee + fee_gst
+
+    flows = np.where(live, instalment[:, None] + gst_interest, 0.0)
+    if flows.shape[1]:
+        flows[:, 0] += upfront - arrays[f"cashback_{mode}"]
+    return flows
+
+
+def _present_value(flows, monthly_rate):
+    """PV of the flows and its derivative with respect to the monthly rate."""
+    months = np.arange(1, flows.shape[1] + 1)
+    discount = np.exp(-months[None, :] * np.log1p(monthly_rate)[:, None])
+    pv = (flows * discount).sum(axis=1)
+    slope = -(months[None, :] * flows * discount).sum(axis=1) / (1 + monthly_rate)
+    return pv, slope
+
+
+def solve_offer_apr(
+    offers,
+    mode="emi",
+    lower=-0.5,
+    upper=1.0,
+    tol=1e-10,
+    max_iter=100,
+) -> pd.DataFrame:
+    """
+    Effective annual cost of each offer: the monthly IRR y at which the
+    mode's outflows (offer_cash_flows) are worth the purchase amount
+    today, reported as APR (12y) and effective annual rate ((1+y)^12 - 1),
+    both in % p.a.
+
+    Vectorized safeguarded Newton: every iteration updates all offers,
+    keeps a sign-change bracket [lower, upper] on the monthly rate and
+    falls back to bisection when a Newton step leaves it. Offers without
+    a sign change get NaN and bracketed=False.
+    """
+    arrays = offer_arrays(offers)
+    flows = offer_cash_flows(arrays, mode)
+    purchase = arrays["purchase_amount"]
+    count = len(purchase)
+
+    def gap(y):
+        pv, slope = _present_value(flows, y)
+        return pv - purchase, slope
+
+    lo = np.full(count, float(lower))
+    hi = np.full(count, float(upper))
+    gap_lo, _ = gap(lo)
+    gap_hi, _ = gap(hi)
+    bracketed = np.sign(gap_lo) * np.sign(gap_hi) <= 0
+
+    y = np.clip(arrays["interest_rate"] / 12 / 100, lo, hi)
+    residual, slope = gap(y)
+    scale = np.maximum(np.abs(purchase), 1.0)
+    active = bracketed & (np.abs(residual) > tol * scale)
+    iterations = np.zeros(count, dtype=int)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        same_side = np.sign(residual) == np.sign(gap_lo)
+        lo = np.where(active & same_side, y, lo)
+        gap_lo = np.where(active & same_side, residual, gap_lo)
+        hi = np.where(active & ~same_side, y, hi)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = y - residual / slope
+        inside = np.isfinite(step) & (step > lo) & (step < hi)
+        y = np.where(active, np.where(inside, step, (lo + hi) / 2), y)
+
+        residual, slope = gap(y)
+        iterations += active
+        active = active & (np.abs(residual) > tol * scale) & (hi - lo > 1e-15)
+
+    monthly = np.where(bracketed, y, np.nan)
+    index = offers.index if isinstance(offers, pd.DataFrame) else None
+    return pd.DataFrame(
+        {
+            "monthly_rate": monthly * 100,
+            "apr": monthly * 12 * 100,
+            "effective_annual_rate": np.expm1(12 * np.log1p(monthly)) * 100,
+            "bracketed": bracketed,
+            "converged": bracketed & ~active,
+            "iterations": iterations,
+            "residual": np.where(bracketed, residual, np.nan),
+        },
+        index=index,
+    )
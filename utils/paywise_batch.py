@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    GST_RATE,
+    calculate_emi,
+    compute_paywise_schedule,
+    fee_terms,
+    net_breakdown_arrays,
+)
+
+OFFER_COLUMNS = [
+    "purchase_amount",
+    "interest_rate",
+    "tenure",
+    "processing_fee_base",
+    "fee_mode",
+    "cashback_full",
+    "cashback_emi",
+    "cashback_nocost",
+]
+
+REQUIRED_OFFER_COLUMNS = ["purchase_amount", "interest_rate", "tenure"]
+
+OFFER_DEFAULTS = {
+    "processing_fee_base": 0.0,
+    "fee_mode": "Fixed",
+    "cashback_full": 0.0,
+    "cashback_emi": 0.0,
+    "cashback_nocost": 0.0,
+}
+
+BREAKDOWN_COMPONENTS = ["principal", "interest", "tax", "fee"]
+PAYMENT_MODES = ["full", "emi", "nocost"]
+
+
+# -------------------------------------------------
+# Input normalisation
+# -------------------------------------------------
+def offer_arrays(offers) -> dict:
+    """
+    Turn a DataFrame (or mapping of columns) of offers into broadcast
+    NumPy arrays keyed by the compute_paywise argument names.
+    Missing fee/cashback columns fall back to OFFER_DEFAULTS.
+    """
+    missing = [name for name in REQUIRED_OFFER_COLUMNS if name not in offers]
+    if missing:
+        raise ValueError(f"Offers are missing required columns: {missing}")
+
+    raw = {
+        name: offers[name] if name in offers else OFFER_DEFAULTS[name]
+        for name in OFFER_COLUMNS
+    }
+    fee_mode = np.asarray(raw.pop("fee_mode"), dtype=str)
+    numeric = [np.asarray(raw[name], dtype=float) for name in raw]
+
+    broadcast = np.broadcast_arrays(*numeric, fee_mode)
+    arrays = {name: np.ravel(arr) for name, arr in zip(raw, broadcast[:-1])}
+    arrays["financed"] = np.char.startswith(np.char.lower(np.ravel(broadcast[-1])), "p")
+    return arrays
+
+
+# -------------------------------------------------
+# Vectorized totals
+# -------------------------------------------------
+def _totals_arrays(arrays: dict) -> dict:
+    fee, fee_gst, principal, upfront_fee, upfront_gst = fee_terms(
+        arrays["purchase_amount"], arrays["processing_fee_base"], arrays["financed"]
+    )
+    tenure = arrays["tenure"]
+    emi = calculate_emi(principal, arrays["interest_rate"], tenure)
+
+    total_interest = np.where(arrays["interest_rate"] == 0, 0.0, tenure * emi - principal)
+    total_gst_interest = total_interest * GST_RATE
+    total_paid = tenure * emi + total_gst_interest + upfront_fee + upfront_gst
+
+    return {
+        "emi": emi,
+        "principal_for_emi": principal,
+        "total_interest": total_interest,
+        "total_gst_interest": total_gst_interest,
+        "total_processing_fee": fee,
+        "total_gst_processing_fee": fee_gst,
+        "total_fee_with_gst": fee + fee_gst,
+        "total_paid": total_paid,
+    }
+
+
+def effective_costs(arrays: dict, totals=None) -> dict:
+    """
+    Vectorized effective cost per payment mode for offer_arrays() output.
+    Lean evaluator for solvers that re-price the same offers many times;
+    pass `totals` when they have already been computed.
+    """
+    totals = _totals_arrays(arrays) if totals is None else totals
+    return {
+        "full": arrays["purchase_amount"] - arrays["cashback_full"],
+        "emi": totals["total_paid"] - arrays["cashback_emi"],
+        "nocost": (
+            arrays["purchase_amount"]
+            + totals["total_gst_interest"]
+            + totals["total_fee_with_gst"]
+            - arrays["cashback_nocost"]
+        ),
+    }
+
+
+def compute_paywise_batch(offers) -> pd.DataFrame:
+    """
+    Columnar compute_paywise: one row of totals, averages, effective
+    costs and net breakdowns per offer. No schedules are built.
+    """
+    result = paywise_batch_arrays(offer_arrays(offers))
+    index = offers.index if isinstance(offers, pd.DataFrame) else None
+    return pd.DataFrame(result, index=index)
+
+
+def paywise_batch_arrays(arrays: dict) -> dict:
+    """
+    compute_paywise_batch on offer_arrays() output, returning a dict of
+    NumPy result columns (cheap to ship between processes).
+    """
+    totals = _totals_arrays(arrays)
+    costs = effective_costs(arrays, totals)
+
+    purchase = arrays["purchase_amount"]
+    tenure = arrays["tenure"]
+
+    result = {
+        "purchase_amount": purchase,
+        "emi": totals["emi"],
+        "total_interest": totals["total_interest"],
+        "total_gst_interest": totals["total_gst_interest"],
+        "total_processing_fee": totals["total_processing_fee"],
+        "total_gst_processing_fee": totals["total_gst_processing_fee"],
+        "total_paid": totals["total_paid"],
+        "effective_cost_full": costs["full"],
+        "effective_cost_emi": costs["emi"],
+        "effective_cost_nocost": costs["nocost"],
+        "avg_monthly_outflow": totals["total_paid"] / tenure,
+        "avg_fee": totals["total_fee_with_gst"] / tenure,
+        "interest_percentage": totals["total_interest"] / purchase * 100,
+    }
+
+    breakdowns = net_breakdown_arrays(
+        purchase,
+        totals["total_interest"],
+        totals["total_gst_interest"],
+        totals["total_fee_with_gst"],
+        arrays["cashback_full"],
+        arrays["cashback_emi"],
+        arrays["cashback_nocost"],
+    )
+    for mode in PAYMENT_MODES:
+        for component in BREAKDOWN_COMPONENTS:
+            result[f"net_{mode}_{component}"] = breakdowns[mode]["net"][component]
+        result[f"net_total_{mode}"] = breakdowns[mode]["net_total"]
+
+    return result
+
+
+# -------------------------------------------------
+# Schedules (only on request)
+# -------------------------------------------------
+def paywise_batch_schedules(offers, rows=None) -> list:
+    """
+    Materialize full emi_df schedules for the offers at positions `rows`
+    (all offers when None).
+    """
+    arrays = offer_arrays(offers)
+    positions = range(len(arrays["purchase_amount"])) if rows is None else rows
+
+    schedules = []
+    for i in positions:
+        schedule = compute_paywise_schedule(
+            purchase_amount=arrays["purchase_amount"][i],
+            interest_rate=arrays["interest_rate"][i],
+            tenure=int(arrays["tenure"][i]),
+            processing_fee_base=arrays["processing_fee_base"][i],
+            fee_mode="Percentage" if arrays["financed"][i] else "Fixed",
+        )
+        schedules.append(schedule["emi_df"])
+    return schedules
@@ -0,0 +1,205 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from utils.calculations import apply_paywise_cashback, compute_paywise_schedule
+
+DEFAULT_MAXSIZE = 256
+DEFAULT_TTL_SECONDS = 15 * 60
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+    ttl: float | None
+
+
+class PaywiseCache:
+    """
+    Thread-safe LRU cache with optional TTL. Values are stored and
+    returned as-is, so callers must cache immutable values (or copy what
+    they hand out).
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL_SECONDS, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl is not None and self._clock() - stored_at > self.ttl:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def configure(self, maxsize=None, ttl=...) -> None:
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 1:
+                    raise ValueError("maxsize must be at least 1")
+                self.maxsize = maxsize
+            if ttl is not ...:
+                self.ttl = ttl
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl=self.ttl,
+            )
+
+
+# -------------------------------------------------
+# Process-wide schedule cache
+# -------------------------------------------------
+_PAYWISE_CACHE = PaywiseCache()
+
+
+def _canonical_amount(value) -> float:
+    # 0.0 and -0.0 (and 20000 vs 20000.0) must share a key
+    return float(value) + 0.0
+
+
+def schedule_cache_key(
+    purchase_amount,
+    interest_rate,
+    tenure,
+    processing_fee_base,
+    fee_mode,
+) -> tuple:
+    return (
+        _canonical_amount(purchase_amount),
+        _canonical_amount(interest_rate),
+        int(tenure),
+        _canonical_amount(max(float(processing_fee_base), 0.0)),
+        "Percentage" if str(fee_mode).lower().startswith("p") else "Fixed",
+    )
+
+
+def cached_paywise_schedule(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    lazy: bool = False,
+) -> dict:
+    """
+    compute_paywise_schedule behind the process-wide LRU cache.
+
+    The cache holds the lazy stage: an AmortizationSchedule (scalar state
+    plus a read-only balance vector; every frame it returns is newly
+    built) and scalar totals. A hit copies only that small dict;
+    `lazy=False` callers get a frame of their own built from the schedule.
+    """
+    key = schedule_cache_key(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+    )
+    schedule = _PAYWISE_CACHE.get(key)
+    if schedule is None:
+        schedule = compute_paywise_schedule(
+            purchase_amount,
+            interest_rate,
+            tenure,
+            processing_fee_base,
+            fee_mode,
+            lazy=True,
+        )
+        _PAYWISE_CACHE.put(key, schedule)
+
+    schedule = dict(schedule)
+    if not lazy:
+        schedule["emi_df"] = schedule["emi_df"].rows()
+    return schedule
+
+
+def cached_compute_paywise(
+    purchase_amount: float,
+    interest_rate: float,
+    tenure: int,
+    processing_fee_base: float,
+    fee_mode: str,
+    cashback_full: float,
+    cashback_emi: float,
+    cashback_nocost: float,
+    lazy: bool = False,
+) -> dict:
+    """
+    compute_paywise on top of the cached schedule stage: cashback edits
+    reuse the schedule and only rerun the constant-time cashback stage.
+    """
+    schedule = cached_paywise_schedule(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+        lazy=lazy,
+    )
+    return apply_paywise_cashback(schedule, cashback_full, cashback_emi, cashback_nocost)
+
+
+def configure_paywise_cache(maxsize=None, ttl=...) -> None:
+    """
+    Resize the cache and/or change its TTL (seconds, None disables expiry).
+    """
+    _PAYWISE_CACHE.configure(maxsize=maxsize, ttl=ttl)
+
+
+def clear_paywise_cache() -> None:
+    _PAYWISE_CACHE.clear()
+
+
+def paywise_cache_stats() -> CacheStats:
+    return _PAYWISE_CACHE.stats()
@@ -0,0 +1,59 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.paywise_batch import offer_arrays, paywise_batch_arrays
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 250_000
+
+
+def _score_block(arrays: dict) -> dict:
+    # Worker entry point: NumPy columns in, NumPy columns out.
+    return paywise_batch_arrays(arrays)
+
+
+def _blocks(arrays: dict, chunk_size: int):
+    count = len(arrays["purchase_amount"])
+    for start in range(0, count, chunk_size):
+        yield {name: values[start:start + chunk_size] for name, values in arrays.items()}
+
+
+def compute_paywise_parallel(
+    offers,
+    workers=None,
+    chunk_size=DEFAULT_PARALLEL_CHUNK_SIZE,
+    executor=None,
+) -> pd.DataFrame:
+    """
+    compute_paywise_batch split into `chunk_size` blocks and scored on a
+    process pool, merged back in input order.
+
+    Blocks travel as dicts of contiguous NumPy columns (pickled as raw
+    buffers), never as per-row dicts. Pass an existing `executor` to reuse
+    one pool across calls; otherwise a pool of `workers` processes
+    (default: CPU count) is created for this call. A single block or
+    workers=1 runs in-process.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    arrays = offer_arrays(offers)
+    index = offers.index if isinstance(offers, pd.DataFrame) else None
+    blocks = list(_blocks(arrays, chunk_size))
+    workers = workers or os.cpu_count() or 1
+
+    if executor is None and (workers == 1 or len(blocks) <= 1):
+        results = [_score_block(block) for block in blocks]
+    elif executor is not None:
+        results = list(executor.map(_score_block, blocks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_score_block, blocks))
+
+    if not results:
+        return pd.DataFrame(paywise_batch_arrays(arrays), index=index)
+
+    merged = {name: np.concatenate([block[name] for block in results]) for name in results[0]}
+    return pd.DataFrame(merged, index=index)
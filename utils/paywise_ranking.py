@@ -0,0 +1,78 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import GST_RATE
+from utils.paywise_batch import PAYMENT_MODES, effective_costs, offer_arrays
+
+
+def offer_lower_bounds(arrays: dict, mode="emi") -> np.ndarray:
+    """
+    Cheap lower bound on the effective cost of each offer for `mode`:
+    purchase plus fee (with GST) minus cashback. Interest and GST on
+    interest are never negative, so the exact cost is always >= this.
+    For "full" the bound is the exact cost.
+    """
+    if mode not in PAYMENT_MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {PAYMENT_MODES}")
+
+    purchase = arrays["purchase_amount"]
+    if mode == "full":
+        return purchase - arrays["cashback_full"]
+    fee_with_gst = np.maximum(arrays["processing_fee_base"], 0.0) * (1 + GST_RATE)
+    return purchase + fee_with_gst - arrays[f"cashback_{mode}"]
+
+
+def rank_offers(offers, k=5, mode="emi", block_size=1024) -> pd.DataFrame:
+    """
+    The `k` cheapest offers by effective cost for `mode`, cheapest first.
+
+    Offers are visited in lower-bound order and priced exactly in blocks,
+    keeping the best k in a bounded heap. Once the next lower bound can no
+    longer beat the k-th best cost the scan stops, so usually only a small
+    prefix of the catalogue is priced. Ties keep input order.
+
+    Returns the selected offer rows with `rank`, `effective_cost` and
+    `lower_bound` columns; attrs["evaluated"] counts exact evaluations.
+    """
+    if k < 1 or block_size < 1:
+        raise ValueError("k and block_size must be positive")
+
+    frame = offers if isinstance(offers, pd.DataFrame) else pd.DataFrame(offers)
+    arrays = offer_arrays(frame)
+    bounds = offer_lower_bounds(arrays, mode)
+    order = np.argsort(bounds, kind="stable")
+
+    heap = []  # (-cost, -position): the root is the worst of the kept offers
+    evaluated = 0
+    for start in range(0, len(order), block_size):
+        block = order[start:start + block_size]
+        if len(heap) == k:
+            worst, worst_position = -heap[0][0], -heap[0][1]
+            block = block[
+                (bounds[block] < worst)
+                | ((bounds[block] == worst) & (block < worst_position))
+            ]
+            if not len(block):
+                break
+
+        subset = {name: values[block] for name, values in arrays.items()}
+        costs = effective_costs(subset)[mode]
+        evaluated += len(block)
+        for position, cost in zip(block.tolist(), costs.tolist()):
+            entry = (-cost, -position)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    best = sorted((-cost, -position) for cost, position in heap)
+    positions = [position for _, position in best]
+
+    ranked = frame.iloc[positions].copy()
+    ranked.insert(0, "rank", np.arange(1, len(positions) + 1))
+    ranked["effective_cost"] = [cost for cost, _ in best]
+    ranked["lower_bound"] = bounds[positions]
+    ranked.attrs["evaluated"] = evaluated
+    return ranked
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import GST_RATE, fee_terms
+from utils.paywise_batch import effective_costs
+
+SENSITIVITY_METRICS = [
+    "effective_cost_emi",
+    "avg_monthly_outflow",
+    "effective_cost_nocost",
+    "effective_cost_full",
+]
+
+LEVERS = [
+    "interest_rate",
+    "tenure",
+    "processing_fee_base",
+    "cashback_full",
+    "cashback_emi",
+    "cashback_nocost",
+]
+
+
+# -------------------------------------------------
+# Exact partial derivatives
+# -------------------------------------------------
+def _emi_partials(principal, monthly_rate, tenure):
+    """
+    EMI and its partials w.r.t. the monthly rate r and tenure n for
+    EMI = P * r / (1 - (1+r)^-n). At r = 0 the series limits are used.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_growth = np.log1p(monthly_rate)
+        discount = np.exp(-tenure * log_growth)
+        annuity = -np.expm1(-tenure * log_growth)
+
+        emi = np.where(
+            monthly_rate == 0,
+            principal / tenure,
+            principal * monthly_rate / annuity,
+        )
+        d_rate = np.where(
+            monthly_rate == 0,
+            principal * (tenure + 1) / (2 * tenure),
+            principal
+            * (annuity - monthly_rate * tenure * discount / (1 + monthly_rate))
+            / annuity**2,
+        )
+        d_tenure = np.where(
+            monthly_rate == 0,
+            -principal / tenure**2,
+            -principal * monthly_rate * discount * log_growth / annuity**2,
+        )
+    return emi, d_rate, d_tenure
+
+
+def paywise_sensitivities(
+    purchase_amount,
+    interest_rate,
+    tenure,
+    processing_fee_base,
+    fee_mode,
+) -> dict:
+    """
+    Exact partial derivatives of the PayWise totals, per unit of each lever:
+    1% p.a. of rate, one month of tenure (treated as continuous), ₹1 of fee
+    and ₹1 of each cashback. Inputs may be scalars or NumPy arrays.
+    Returns {lever: {metric: derivative}}.
+    """
+    tenure = np.asarray(tenure, dtype=float)
+    financed = np.char.startswith(np.char.lower(np.asarray(fee_mode, dtype=str)), "p")
+    _, _, principal, upfront_fee, upfront_gst = fee_terms(
+        np.asarray(purchase_amount, dtype=float),
+        np.asarray(processing_fee_base, dtype=float),
+        financed,
+    )
+    upfront = upfront_fee + upfront_gst
+    monthly_rate = np.asarray(interest_rate, dtype=float) / 12 / 100
+
+    emi, d_emi_d_r, d_emi_d_n = _emi_partials(principal, monthly_rate, tenure)
+    total_paid = (1 + GST_RATE) * tenure * emi - GST_RATE * principal + upfront
+
+    # d(n * EMI) for each lever
+    d_sum_rate = tenure * d_emi_d_r / 1200
+    d_sum_tenure = emi + tenure * d_emi_d_n
+    d_principal_fee = np.where(financed, 1 + GST_RATE, 0.0)
+    d_upfront_fee = np.where(financed, 0.0, 1 + GST_RATE)
+    d_sum_fee = tenure * (emi / principal) * d_principal_fee
+
+    d_paid_rate = (1 + GST_RATE) * d_sum_rate
+    d_paid_tenure = (1 + GST_RATE) * d_sum_tenure
+    d_paid_fee = (1 + GST_RATE) * d_sum_fee - GST_RATE * d_principal_fee + d_upfront_fee
+
+    zero = np.zeros_like(total_paid)
+    one = np.ones_like(total_paid)
+
+    return {
+        "interest_rate": {
+            "effective_cost_emi": d_paid_rate,
+            "avg_monthly_outflow": d_paid_rate / tenure,
+            "effective_cost_nocost": GST_RATE * d_sum_rate,
+            "effective_cost_full": zero,
+        },
+        "tenure": {
+            "effective_cost_emi": d_paid_tenure,
+            "avg_monthly_outflow": (d_paid_tenure * tenure - total_paid) / tenure**2,
+            "effective_cost_nocost": GST_RATE * d_sum_tenure,
+            "effective_cost_full": zero,
+        },
+        "processing_fee_base": {
+            "effective_cost_emi": d_paid_fee,
+            "avg_monthly_outflow": d_paid_fee / tenure,
+            "effective_cost_nocost": (
+                GST_RATE * (d_sum_fee - d_principal_fee) + (1 + GST_RATE)
+            ),
+            "effective_cost_full": zero,
+        },
+        "cashback_full": {
+            "effective_cost_emi": zero,
+            "avg_monthly_outflow": zero,
+            "effective_cost_nocost": zero,
+            "effective_cost_full": -one,
+        },
+        "cashback_emi": {
+            "effective_cost_emi": -one,
+            "avg_monthly_outflow": zero,
+            "effective_cost_nocost": zero,
+            "effective_cost_full": zero,
+        },
+        "cashback_nocost": {
+            "effective_cost_emi": zero,
+            "avg_monthly_outflow": zero,
+            "effective_cost_nocost": -one,
+            "effective_cost_full": zero,
+        },
+    }
+
+
+# -------------------------------------------------
+# Exact what-ifs for arbitrary deltas
+# -------------------------------------------------
+def paywise_delta_arrays(
+    purchase_amount,
+    interest_rate,
+    tenure,
+    processing_fee_base,
+    fee_mode,
+    cashback_full,
+    cashback_emi,
+    cashback_nocost,
+    deltas,
+) -> dict:
+    """
+    Exact change in each metric for every (lever, delta) pair in `deltas`
+    (a list of pairs, or a mapping of lever -> list of deltas), priced
+    together with the base scenario in one effective_costs call over
+    float arrays. Returns {metric: array of changes, one per pair}.
+    """
+    if hasattr(deltas, "items"):
+        deltas = [(lever, delta) for lever, values in deltas.items() for delta in values]
+
+    unknown = sorted({lever for lever, _ in deltas} - set(LEVERS))
+    if unknown:
+        raise ValueError(f"Unknown levers: {unknown}; expected some of {LEVERS}")
+
+    base = {
+        "purchase_amount": purchase_amount,
+        "interest_rate": interest_rate,
+        "tenure": tenure,
+        "processing_fee_base": processing_fee_base,
+        "cashback_full": cashback_full,
+        "cashback_emi": cashback_emi,
+        "cashback_nocost": cashback_nocost,
+    }
+    arrays = {name: np.full(len(deltas) + 1, float(value)) for name, value in base.items()}
+    for position, (lever, delta) in enumerate(deltas, start=1):
+        arrays[lever][position] += delta
+    arrays["financed"] = np.full(len(deltas) + 1, str(fee_mode).lower().startswith("p"))
+
+    costs = effective_costs(arrays)
+    total_paid = costs["emi"] + arrays["cashback_emi"]
+    metrics = {
+        "effective_cost_emi": costs["emi"],
+        "avg_monthly_outflow": total_paid / arrays["tenure"],
+        "effective_cost_nocost": costs["nocost"],
+        "effective_cost_full": costs["full"],
+    }
+    return {name: values[1:] - values[0] for name, values in metrics.items()}
+
+
+def paywise_deltas(
+    purchase_amount,
+    interest_rate,
+    tenure,
+    processing_fee_base,
+    fee_mode,
+    cashback_full,
+    cashback_emi,
+    cashback_nocost,
+    deltas,
+) -> pd.DataFrame:
+    """
+    paywise_delta_arrays as a DataFrame with "lever" and "delta" columns.
+    """
+    if hasattr(deltas, "items"):
+        deltas = [(lever, delta) for lever, values in deltas.items() for delta in values]
+
+    changes = paywise_delta_arrays(
+        purchase_amount,
+        interest_rate,
+        tenure,
+        processing_fee_base,
+        fee_mode,
+        cashback_full,
+        cashback_emi,
+        cashback_nocost,
+        deltas,
+    )
+    frame = pd.DataFrame(changes, columns=SENSITIVITY_METRICS)
+    frame.insert(0, "delta", [delta for _, delta in deltas])
+    frame.insert(0, "lever", [lever for lever, _ in deltas])
+    return frame
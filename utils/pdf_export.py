@@ -14,6 +14,8 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 
+from utils.calculations import schedule_frame
+
 
 # -------------------------------------------------
 # Donut chart → image buffer
@@ -216,7 +218,7 @@ def generate_pdf_report(
     elements.append(Paragraph("<b>Detailed Payment Schedule</b>", styles["Heading2"]))
     elements.append(Spacer(1, 10))
 
-    schedule_df = emi_df.copy()
+    schedule_df = schedule_frame(emi_df).copy()
     schedule_columns = schedule_df.columns.tolist()
 
     if fee_mode_normalized == "Percentage":
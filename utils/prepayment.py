@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    GST_RATE,
+    annuity_balance,
+    annuity_payment,
+    annuity_payoff,
+    annuity_segment,
+    annuity_term,
+    calculate_emi,
+)
+
+PREPAYMENT_MODES = ("reduce_emi", "reduce_tenure")
+
+PREPAYMENT_COLUMNS = [
+    "Month",
+    "EMI",
+    "Principal Paid",
+    "Interest",
+    "GST on Interest (@18%)",
+    "Prepayment",
+    "Total Payment",
+    "Principal Remaining",
+]
+
+
+def _pack_plans(plans):
+    """
+    List of plans (each a list of (month, amount, mode) events) to padded
+    (plans x events) arrays sorted by month. Padding events never fire.
+    """
+    width = max((len(events) for events in plans), default=0)
+    months = np.full((len(plans), width), np.inf)
+    amounts = np.zeros((len(plans), width))
+    reduce_emi = np.zeros((len(plans), width), dtype=bool)
+
+    for row, events in enumerate(plans):
+        for col, (month, amount, mode) in enumerate(sorted(events, key=lambda e: e[0])):
+            if mode not in PREPAYMENT_MODES:
+                raise ValueError(f"Unknown mode {mode!r}; expected one of {PREPAYMENT_MODES}")
+            if month < 1:
+                raise ValueError("Prepayment month must be 1 or later")
+            months[row, col] = month
+            amounts[row, col] = max(float(amount), 0.0)
+            reduce_emi[row, col] = mode == "reduce_emi"
+    return months, amounts, reduce_emi
+
+
+def evaluate_prepayment_plans(principal, annual_rate, tenure, plans) -> pd.DataFrame:
+    """
+    Totals for many candidate prepayment plans on the same loan.
+
+    Each event (month, amount, mode) is paid right after that month's EMI
+    and either keeps the end date and lowers the EMI ("reduce_emi") or
+    keeps the EMI and shortens the loan ("reduce_tenure"). Plans are
+    evaluated together, one closed-form annuity segment per event, so the
+    cost scales with events rather than months.
+    """
+    months, amounts, reduce_emi = _pack_plans(plans)
+    count = len(plans)
+    r = annual_rate / 12 / 100
+    base_emi = calculate_emi(principal, annual_rate, tenure)
+
+    balance = np.full(count, float(principal))
+    emi = np.full(count, base_emi)
+    elapsed = np.zeros(count)
+    paid = np.zeros(count)
+    prepaid = np.zeros(count)
+
+    for col in range(months.shape[1]):
+        month = months[:, col]
+        # events in or after the payoff month never fire
+        fires = (month < elapsed + annuity_term(balance, r, emi) - 1e-9) & (balance > 0)
+        step = np.where(fires, month - elapsed, 0)
+
+        paid += step * emi
+        balance = np.where(fires, annuity_balance(balance, r, emi, step), balance)
+        elapsed = np.where(fires, month, elapsed)
+        instalments_left = np.ceil(annuity_term(balance, r, emi) - 1e-9)
+
+        amount = np.where(fires, np.minimum(amounts[:, col], balance), 0.0)
+        balance -= amount
+        prepaid += amount
+
+        reset = fires & reduce_emi[:, col] & (balance > 0)
+        emi = np.where(reset, annuity_payment(balance, r, np.maximum(instalments_left, 1)), emi)
+
+    payments, closing_paid = annuity_payoff(balance, r, emi)
+    paid += closing_paid
+    total_interest = paid + prepaid - principal
+    base_interest = base_emi * tenure - principal
+
+    return pd.DataFrame({
+        "months": elapsed + payments,
+        "final_emi": emi,
+        "total_prepaid": prepaid,
+        "total_interest": total_interest,
+        "total_gst_interest": total_interest * GST_RATE,
+        "total_paid": paid + prepaid + total_interest * GST_RATE,
+        "interest_saved": base_interest - total_interest,
+        "months_saved": tenure - (elapsed + payments),
+    })
+
+
+def prepayment_schedule(principal, annual_rate, tenure, events) -> pd.DataFrame:
+    """
+    Month-by-month schedule for one prepayment plan, built segment by
+    segment from the closed-form balance between events.
+    """
+    months, amounts, reduce_emi = _pack_plans([events])
+    r = annual_rate / 12 / 100
+
+    balance = float(principal)
+    emi = calculate_emi(principal, annual_rate, tenure)
+    elapsed = 0
+    segments = []
+
+    events = list(zip(months[0], amounts[0], reduce_emi[0])) + [(np.inf, 0.0, False)]
+    for month, amount, to_emi in events:
+        last_month = elapsed + int(np.ceil(annuity_term(balance, r, emi) - 1e-9))
+        stop = int(min(month, last_month))
+        if stop > elapsed:
+            segments.append({
+                "start": elapsed,
+                "stop": stop,
+                "balance": balance,
+                "emi": emi,
+                "prepayment": 0.0,
+            })
+            balance = float(annuity_balance(balance, r, emi, stop - elapsed))
+            elapsed = stop
+        if month >= last_month:
+            break
+
+        instalments_left = int(np.ceil(annuity_term(balance, r, emi) - 1e-9))
+        amount = min(amount, balance)
+        segments[-1]["prepayment"] += amount
+        balance -= amount
+        if balance <= 0:
+            break
+        if to_emi:
+            emi = float(annuity_payment(balance, r, max(instalments_left, 1)))
+
+    frames = []
+    for segment in segments:
+        steps = np.arange(segment["stop"] - segment["start"])
+        rows = annuity_segment(segment["balance"], r, segment["emi"], len(steps))
+        interest = rows["interest"]
+        principal_paid = rows["principal_paid"]
+        prepayment = np.zeros(len(steps))
+        prepayment[-1] = segment["prepayment"]
+
+        frames.append(pd.DataFrame({
+            "Month": segment["start"] + steps + 1,
+            "EMI": principal_paid + interest,
+            "Principal Paid": principal_paid,
+            "Interest": interest,
+            "GST on Interest (@18%)": interest * GST_RATE,
+            "Prepayment": prepayment,
+            "Total Payment": principal_paid + interest * (1 + GST_RATE) + prepayment,
+            "Principal Remaining": np.maximum(
+                rows["opening"] - principal_paid - prepayment, 0
+            ),
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=PREPAYMENT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[PREPAYMENT_COLUMNS]
@@ -0,0 +1,103 @@
+import numpy as np
+
+from utils.bisection import bisect_roots
+from utils.investment import sip_final_values
+
+GOAL_TARGETS = ("real", "nominal")
+
+
+def _check_target(value):
+    if value not in GOAL_TARGETS:
+        raise ValueError(f"Unknown target {value!r}; expected one of {GOAL_TARGETS}")
+
+
+def required_monthly_sip(
+    target,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    value="real",
+):
+    """
+    Starting monthly SIP whose final `value` ("real" or "nominal") equals
+    `target`. The final value is linear in the SIP, so this is the target
+    divided by the value of a ₹1 SIP; NaN when that value is not positive.
+    Broadcasts over every argument.
+    """
+    _check_target(value)
+    per_rupee = sip_final_values(
+        1.0,
+        annual_stepup_percent,
+        annual_return_percent,
+        annual_inflation_percent,
+        np.asarray(years) * 12,
+    )[value]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(per_rupee > 0, np.asarray(target, dtype=float) / per_rupee, np.nan)
+
+
+def required_stepup(
+    target,
+    monthly_sip,
+    annual_return_percent,
+    annual_inflation_percent,
+    years,
+    value="real",
+    lower=0.0,
+    upper=100.0,
+    tol=1e-6,
+    max_iter=100,
+):
+    """
+    Annual step-up % at which the final `value` reaches `target`.
+    Vectorized bisection on [lower, upper] over the closed-form values.
+    Returns `lower` where the target is already met there and NaN where
+    even `upper` falls short.
+    """
+    _check_target(value)
+
+    def gap(stepup):
+        final = sip_final_values(
+            monthly_sip,
+            stepup,
+            annual_return_percent,
+            annual_inflation_percent,
+            np.asarray(years) * 12,
+        )[value]
+        return final - target
+
+    shape = np.broadcast_shapes(
+        *map(np.shape, (target, monthly_sip, annual_return_percent, annual_inflation_percent, years))
+    )
+    lo = np.full(shape, float(lower))
+    hi = np.full(shape, float(upper))
+    stepup = bisect_roots(gap, lo, hi, tol=tol, max_iter=max_iter)["root"]
+    return np.where(gap(lo) >= 0, lo, stepup)
+
+
+def required_years(
+    target,
+    monthly_sip,
+    annual_stepup_percent,
+    annual_return_percent,
+    annual_inflation_percent,
+    value="real",
+    max_years=100,
+):
+    """
+    Fewest whole years after which the final `value` reaches `target`
+    (NaN if not within `max_years`). All year-ends are evaluated in one
+    closed-form call along a trailing axis.
+    """
+    _check_target(value)
+    completed = np.arange(1, max_years + 1)
+    finals = sip_final_values(
+        np.asarray(monthly_sip)[..., None],
+        np.asarray(annual_stepup_percent)[..., None],
+        np.asarray(annual_return_percent)[..., None],
+        np.asarray(annual_inflation_percent)[..., None],
+        completed * 12,
+    )[value]
+    reached = finals >= np.asarray(target, dtype=float)[..., None]
+    return np.where(reached.any(axis=-1), completed[reached.argmax(axis=-1)], np.nan)